@@ -12,6 +12,8 @@ import math
 from datetime import datetime
 from typing import Dict, Tuple, Union
 
+import numpy as np
+
 try:
     import swisseph as swe
 
@@ -342,6 +344,68 @@ class EphemerisEngine:
 
         return positions
 
+    def get_all_planet_positions_batch(
+        self, julian_days: np.ndarray
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calculate longitudes and speeds for all traditional planets at many times.
+
+        Column-oriented counterpart of ``get_all_planet_positions`` for time
+        series work: each planet's values are written straight into float64
+        arrays, skipping the per-call sign, retrograde and combustion fields.
+
+        Args:
+            julian_days: Array of Julian day numbers
+
+        Returns:
+            Dictionary mapping planet names to ``{"longitude": ndarray,
+            "longitude_speed": ndarray}``, each aligned with ``julian_days``
+        """
+        julian_days = np.asarray(julian_days, dtype=np.float64)
+        planets = {
+            "Sun": swe.SUN,
+            "Moon": swe.MOON,
+            "Mars": swe.MARS,
+            "Mercury": swe.MERCURY,
+            "Jupiter": swe.JUPITER,
+            "Venus": swe.VENUS,
+            "Saturn": swe.SATURN,
+            "Rahu": swe.TRUE_NODE,
+        }
+
+        positions = {}
+        for planet_name, planet_const in planets.items():
+            longitude = np.empty(len(julian_days))
+            speed = np.empty(len(julian_days))
+            for i, julian_day in enumerate(julian_days):
+                coordinates = swe.calc_ut(julian_day, planet_const)[0]
+                longitude[i] = coordinates[0]
+                speed[i] = coordinates[3]
+
+            if not self.sidereal_mode_set:
+                longitude = np.array(
+                    [
+                        convert_tropical_to_sidereal(
+                            lon, get_ayanamsa_offset(jd, self.ayanamsa_system)
+                        )
+                        for lon, jd in zip(longitude, julian_days)
+                    ]
+                )
+
+            positions[planet_name] = {
+                "longitude": longitude % 360,
+                "longitude_speed": speed,
+            }
+
+        # Ketu is always 180 degrees opposite to Rahu
+        rahu = positions["Rahu"]
+        positions["Ketu"] = {
+            "longitude": (rahu["longitude"] + 180) % 360,
+            "longitude_speed": rahu["longitude_speed"].copy(),
+        }
+
+        return positions
+
     def _planet_name_to_constant(self, planet_name: str) -> int:
         """
         Convert planet name to Swiss Ephemeris constant.
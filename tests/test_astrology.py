@@ -151,6 +151,23 @@ class TestEphemerisEngine(unittest.TestCase):
         self.assertGreaterEqual(position["longitude"], 0)
         self.assertLess(position["longitude"], 360)
 
+    def test_batch_positions_match_single(self):
+        """Test batched positions agree with per-date positions."""
+        if not self.ephemeris_available:
+            self.skipTest("Swiss Ephemeris not available")
+
+        jds = [2460311.0, 2460312.0, 2460400.5]
+        batch = self.ephemeris.get_all_planet_positions_batch(jds)
+
+        for i, jd in enumerate(jds):
+            single = self.ephemeris.get_all_planet_positions(jd)
+            self.assertEqual(list(batch), list(single))
+            for planet, data in single.items():
+                self.assertAlmostEqual(batch[planet]["longitude"][i], data["longitude"])
+                self.assertAlmostEqual(
+                    batch[planet]["longitude_speed"][i], data["longitude_speed"]
+                )
+
     @unittest.skipUnless(hasattr(unittest, "assertLogs"), "assertLogs not available")
     def test_ephemeris_error_handling(self):
         """Test error handling when ephemeris is not available."""
@@ -132,6 +132,55 @@ class TestResearchPipelinePhase1(unittest.TestCase):
         self.assertIn("independent", ids)
         self.assertNotIn("aftershock", ids)
 
+        # Events are tracked by position, so a shared (empty) usgs_url must
+        # not make independent events shadow each other.
+        for eq in catalog:
+            eq["usgs_url"] = ""
+        self.assertEqual(len(fetcher.decluster_catalog(catalog)), 2)
+
+        # Degenerate inputs (including generators) pass straight through.
+        self.assertEqual(fetcher.decluster_catalog([]), [])
+        self.assertEqual(fetcher.decluster_catalog(iter(catalog[:1])), catalog[:1])
+
+    def test_chunked_fetch_merges_sub_queries(self):
+        """Test that long ranges are split into monthly sub-queries."""
+        sys.path.append(
+            os.path.abspath(
+                os.path.join(
+                    os.path.dirname(__file__), "../use_cases/earthquake/scripts"
+                )
+            )
+        )
+        from earthquake_data_fetcher import EarthquakeDataFetcher, _date_chunks
+
+        chunks = _date_chunks("2020-01-01", "2021-01-01")
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0], ("2020-01-01", "2020-04-01"))
+        self.assertEqual(chunks[-1], ("2020-10-01", "2021-01-01"))
+
+        fetcher = EarthquakeDataFetcher(use_sample_data=True)
+
+        def fake_fetch(start, end, *args):
+            # Every chunk returns its own event plus one shared boundary event.
+            return {
+                "metadata": {"count": 2},
+                "features": [
+                    {"id": start, "properties": {"mag": 5.0}},
+                    {"id": "boundary", "properties": {"mag": 7.0}},
+                ],
+            }
+
+        fetcher._fetch_from_usgs_api = fake_fetch
+        data = fetcher.fetch_earthquakes(
+            "2020-01-01", "2021-06-30", min_magnitude=5.0, use_usgs_api=True
+        )
+
+        ids = [f["id"] for f in data["features"]]
+        self.assertEqual(ids[0], "boundary")
+        self.assertEqual(ids.count("boundary"), 1)
+        self.assertEqual(len(ids), 19)
+        self.assertEqual(data["metadata"]["count"], 19)
+
 
 if __name__ == "__main__":
     unittest.main()
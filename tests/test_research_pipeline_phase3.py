@@ -1,5 +1,7 @@
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -35,9 +37,13 @@ class TestResearchPipelinePhase3(unittest.TestCase):
         df = pd.DataFrame(data)
         df.to_csv(self.test_matrix_path, index=False)
 
+        # Keep the matrix snapshot out of the repo's data directory
+        self.cache_dir = tempfile.mkdtemp()
+
     def tearDown(self):
         if os.path.exists(self.test_matrix_path):
             os.remove(self.test_matrix_path)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
 
     def test_model_training_execution(self):
         """Test that train_models runs without crashing on valid data."""
@@ -46,14 +52,15 @@ class TestResearchPipelinePhase3(unittest.TestCase):
         # Capture stdout to check for success messages
         # We just want to ensure it calls fit() and produces output
         try:
-            train_models.train_models(self.test_matrix_path)
+            train_models.train_models(self.test_matrix_path, cache_dir=self.cache_dir)
         except Exception as e:
             self.fail(f"train_models failed with exception: {e}")
 
         # Check if output JSON was created
         self.assertTrue(os.path.exists("model_results.json"))
-        if os.path.exists("model_results.json"):
-            os.remove("model_results.json")
+        for output in ("model_results.json", "model_results.key"):
+            if os.path.exists(output):
+                os.remove(output)
 
 
 if __name__ == "__main__":
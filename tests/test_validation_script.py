@@ -1,5 +1,7 @@
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -19,6 +21,8 @@ class TestValidationScript(unittest.TestCase):
     def setUp(self):
         # Create a dummy regression matrix for testing
         self.test_matrix_path = "test_validation_matrix.csv"
+        # Keep the Monte Carlo cache out of the repo's data directory
+        self.cache_dir = tempfile.mkdtemp()
 
         # Random data
         dates = pd.date_range(start="2023-01-01", periods=50)  # 50 days
@@ -34,6 +38,7 @@ class TestValidationScript(unittest.TestCase):
         df.to_csv(self.test_matrix_path, index=False)
 
     def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
         if os.path.exists(self.test_matrix_path):
             os.remove(self.test_matrix_path)
         if os.path.exists("validation_report.json"):
@@ -47,7 +52,9 @@ class TestValidationScript(unittest.TestCase):
 
         # Use small number of shuffles for speed
         try:
-            validate_results.run_validation(self.test_matrix_path, n_shuffles=10)
+            validate_results.run_validation(
+                self.test_matrix_path, n_shuffles=10, cache_dir=self.cache_dir
+            )
         except Exception as e:
             self.fail(f"run_validation failed with: {e}")
 
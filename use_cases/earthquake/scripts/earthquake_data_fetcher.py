@@ -5,13 +5,278 @@ Payload-driven system to fetch earthquake data from the USGS API
 and store it locally for offline research analysis.
 """
 
+import gzip
+import hashlib
+import inspect
 import json
+import math
+import pickle
+import warnings
+import numpy as np
+import pandas as pd
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import os
 from pathlib import Path
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for pandas)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from sklearn.neighbors import BallTree
+
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+try:
+    import numexpr
+
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
+
+MS_PER_DAY = 86_400_000
+
+
+def _to_epoch_ms(values: List) -> np.ndarray:
+    """
+    Convert timestamps (ISO strings or datetimes) to int64 epoch milliseconds.
+
+    Parsing happens in one vectorized call; naive values are treated as UTC.
+    Values pandas cannot parse fall back to their leading YYYY-MM-DD date.
+    """
+    # Fast path: offset-free ISO strings (the process_for_analysis format) and
+    # naive datetimes are parsed by NumPy directly. NumPy only warns about
+    # timezone suffixes, so warnings are raised to fall through to pandas.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            times = np.array(values, dtype="datetime64[ms]")
+        except (ValueError, TypeError, UserWarning):
+            times = None
+    if times is not None and not np.isnat(times).any():
+        return times.astype(np.int64)
+
+    values = pd.Series(values)
+    parsed = pd.to_datetime(values, utc=True, format="mixed", errors="coerce")
+    unparsed = parsed.isna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(
+            values[unparsed].astype(str).str[:10], utc=True
+        )
+    epoch = pd.Timestamp(0, tz="UTC")
+    return ((parsed - epoch) // pd.Timedelta(milliseconds=1)).to_numpy(np.int64)
+
+
+EARTH_RADIUS_KM = np.float32(6371.0)
+
+# Gardner-Knopoff (1974) aftershock windows: magnitude -> (distance km, days).
+_GK_MAGS = np.array([2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0])
+_GK_WINDOWS = np.array(
+    [
+        [19.5, 6],
+        [22.5, 11.5],
+        [26, 22],
+        [30, 42],
+        [35, 83],
+        [40, 155],
+        [47, 290],
+        [54, 510],
+        [61, 790],
+        [70, 915],
+        [81, 960],
+        [94, 985],
+    ]
+)
+
+
+def _haversine_km(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    cos_lat1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    cos_lat2: np.ndarray,
+) -> np.ndarray:
+    """
+    Great-circle distance in km between points given in (float32) radians.
+
+    The Gardner-Knopoff windows are only accurate to about a kilometre, so
+    single precision is sufficient; numexpr fuses the formula into one pass
+    when it is installed.
+    """
+    if NUMEXPR_AVAILABLE:
+        return numexpr.evaluate(
+            "2 * R * arcsin(sqrt(sin((lat2 - lat1) * 0.5) ** 2"
+            " + cos_lat1 * cos_lat2 * sin((lon2 - lon1) * 0.5) ** 2))",
+            local_dict={
+                "R": EARTH_RADIUS_KM,
+                "lat1": lat1,
+                "lon1": lon1,
+                "cos_lat1": cos_lat1,
+                "lat2": lat2,
+                "lon2": lon2,
+                "cos_lat2": cos_lat2,
+            },
+        )
+
+    a = (
+        np.sin((lat2 - lat1) * np.float32(0.5)) ** 2
+        + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) * np.float32(0.5)) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _decluster_kernel(
+        lat_rad,
+        lon_rad,
+        cos_lat,
+        times_ms,
+        dist_km,
+        window_ms,
+        max_dlat,
+        max_dlon,
+        time_order,
+        times_sorted,
+        removed,
+    ):
+        """
+        Fused Gardner-Knopoff pair search over magnitude-sorted events.
+
+        Marks aftershocks in ``removed`` in place. The outer loop must stay
+        sequential because each mainshock depends on earlier removals. Only
+        events inside the mainshock's time window are visited (located by
+        binary search in the time-sorted index), and the latitude/longitude
+        bounds from ``_angular_bounds`` reject most of those before any
+        trigonometry.
+        """
+        n = lat_rad.shape[0]
+        for i in range(n):
+            if removed[i]:
+                continue
+            lo = np.searchsorted(times_sorted, times_ms[i] - window_ms[i], "left")
+            hi = np.searchsorted(times_sorted, times_ms[i] + window_ms[i], "right")
+            for k in range(lo, hi):
+                j = time_order[k]
+                if j <= i or removed[j]:
+                    continue
+                if abs(lat_rad[j] - lat_rad[i]) > max_dlat[i]:
+                    continue
+                dlon = abs(lon_rad[j] - lon_rad[i])
+                if min(dlon, 2.0 * math.pi - dlon) > max_dlon[i]:
+                    continue
+                a = (
+                    math.sin((lat_rad[j] - lat_rad[i]) * 0.5) ** 2
+                    + cos_lat[i]
+                    * cos_lat[j]
+                    * math.sin((lon_rad[j] - lon_rad[i]) * 0.5) ** 2
+                )
+                if 2.0 * 6371.0 * math.asin(math.sqrt(a)) <= dist_km[i]:
+                    removed[j] = 1
+
+
+def _angular_bounds(
+    lat_rad: np.ndarray, cos_lat: np.ndarray, dist_km: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-event latitude/longitude gaps beyond which no point can be in range.
+
+    The great-circle distance is at least R * |dlat|. For points inside that
+    latitude band it is also at least (2R / pi) * sqrt(cos_lat1 * cos_lat2)
+    * |dlon|, using sin(x / 2) >= x / pi on [0, pi] and the smallest cosine
+    the band allows. Both bounds are widened slightly to absorb float32
+    rounding, so they only ever skip pairs the haversine would reject.
+    """
+    slack = np.float32(1.001)
+    max_dlat = dist_km / EARTH_RADIUS_KM * slack
+    cos_band = np.cos(np.minimum(np.abs(lat_rad) + max_dlat, np.float32(np.pi / 2)))
+    with np.errstate(divide="ignore"):
+        max_dlon = (
+            dist_km
+            * np.float32(np.pi)
+            / (2 * EARTH_RADIUS_KM * np.sqrt(np.maximum(cos_lat * cos_band, 0)))
+            * slack
+        )
+    return max_dlat, max_dlon
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes to ``path`` via a temporary file and ``os.replace``."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _date_chunks(start: str, end: str, months: int = 3) -> List[Tuple[str, str]]:
+    """
+    Split a YYYY-MM-DD date range into consecutive ``months``-long windows.
+
+    Adjacent windows share their boundary date; callers merging the results
+    should de-duplicate events on that boundary.
+    """
+    start_d = date.fromisoformat(start)
+    end_d = date.fromisoformat(end)
+
+    chunks = []
+    chunk_start = start_d
+    while chunk_start < end_d:
+        month_index = chunk_start.month - 1 + months
+        chunk_end = date(
+            chunk_start.year + month_index // 12, month_index % 12 + 1, 1
+        )
+        chunk_end = min(chunk_end, end_d)
+        chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+        chunk_start = chunk_end
+
+    return chunks or [(start, end)]
+
 
 class EarthquakeDataFetcher:
     """Fetch and process earthquake data from multiple sources."""
@@ -23,19 +288,57 @@ class EarthquakeDataFetcher:
     DEFAULT_MAGNITUDE = 5.0
     DEFAULT_FORMAT = "geojson"
 
-    def __init__(self, use_sample_data: bool = False, verbose: bool = False):
+    # Ranges longer than this are split into monthly sub-queries so each
+    # request stays well below the USGS 20,000-event cap.
+    CHUNK_THRESHOLD_DAYS = 31
+    CHUNK_MONTHS = 1
+    MAX_WORKERS = 8
+
+    # Cached responses younger than this are served without contacting USGS;
+    # older ones are revalidated with If-None-Match / If-Modified-Since.
+    # Windows that ended more than HISTORICAL_AGE ago are served from the
+    # cache indefinitely, since past catalogs are effectively frozen.
+    CACHE_MAX_AGE = timedelta(days=1)
+    HISTORICAL_AGE = timedelta(days=7)
+
+    def __init__(
+        self,
+        use_sample_data: bool = False,
+        verbose: bool = False,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize the earthquake data fetcher.
 
         Args:
             use_sample_data: Discarded in production parity.
             verbose: If True, print detailed logging
+            cache_dir: Directory for the HTTP response cache
+                (defaults to ``data/usgs_cache``)
         """
         self.use_sample_data = use_sample_data
         self.verbose = verbose
         self.sample_data_path = (
             Path(__file__).parent.parent / "data" / "sample_earthquakes.json"
         )
+        self.cache_dir = Path(
+            cache_dir or Path(__file__).parent.parent / "data" / "usgs_cache"
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.MAX_WORKERS,
+                pool_maxsize=self.MAX_WORKERS,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
 
     def fetch_earthquakes(
         self,
@@ -62,7 +365,7 @@ class EarthquakeDataFetcher:
         """
         if use_usgs_api:
             try:
-                return self._fetch_from_usgs_api(
+                return self._fetch_chunked(
                     start_date, end_date, min_magnitude, latitude_range, longitude_range
                 )
             except Exception as e:
@@ -75,11 +378,73 @@ class EarthquakeDataFetcher:
         # But for this function signature, we'll enforce API if sample data was previously the default
         self._log("⚠️ USGS API flag not set, but mock data is disabled.")
         self._log("Attempting API fetch as fallback for real data...")
-        return self._fetch_from_usgs_api(
+        return self._fetch_chunked(
              start_date, end_date, min_magnitude, 
              latitude_range, longitude_range
         )
 
+    def _fetch_chunked(
+        self,
+        start_date: str,
+        end_date: str,
+        min_magnitude: float,
+        latitude_range: Optional[Tuple[float, float]] = None,
+        longitude_range: Optional[Tuple[float, float]] = None,
+    ) -> Dict:
+        """
+        Fetch a long date range as parallel monthly USGS sub-queries.
+
+        Short ranges are fetched with a single request. Longer ranges are
+        split with ``_date_chunks`` and fetched concurrently over the shared
+        session; the features are merged, de-duplicated on chunk boundaries
+        and re-ordered largest-first to match a single-query response.
+        """
+        span = date.fromisoformat(end_date) - date.fromisoformat(start_date)
+        if span.days <= self.CHUNK_THRESHOLD_DAYS:
+            return self._fetch_from_usgs_api(
+                start_date, end_date, min_magnitude, latitude_range, longitude_range
+            )
+
+        chunks = _date_chunks(start_date, end_date, self.CHUNK_MONTHS)
+        self._log(f"Splitting {start_date}..{end_date} into {len(chunks)} sub-queries")
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            results = list(
+                pool.map(
+                    lambda chunk: self._fetch_from_usgs_api(
+                        chunk[0],
+                        chunk[1],
+                        min_magnitude,
+                        latitude_range,
+                        longitude_range,
+                    ),
+                    chunks,
+                )
+            )
+
+        features = []
+        seen_ids = set()
+        for result in results:
+            for feature in result.get("features", []):
+                feature_id = feature.get("id")
+                if feature_id is not None:
+                    if feature_id in seen_ids:
+                        continue
+                    seen_ids.add(feature_id)
+                features.append(feature)
+
+        features.sort(
+            key=lambda f: f.get("properties", {}).get("mag") or 0, reverse=True
+        )
+
+        merged = dict(results[0])
+        merged["features"] = features
+        if isinstance(merged.get("metadata"), dict):
+            merged["metadata"] = dict(merged["metadata"], count=len(features))
+
+        self._log(f"✅ Merged {len(features)} earthquakes from {len(chunks)} chunks")
+        return merged
+
     def _fetch_from_usgs_api(
         self,
         start_date: str,
@@ -115,184 +480,375 @@ class EarthquakeDataFetcher:
             params["minlongitude"] = longitude_range[0]
             params["maxlongitude"] = longitude_range[1]
 
-        try:
-            response = requests.get(self.USGS_API_BASE, params=params, timeout=10)
-            response.raise_for_status()
+        cache_key = hashlib.sha256(
+            json.dumps(params, sort_keys=True).encode()
+        ).hexdigest()
+        body_path = self.cache_dir / f"{cache_key}.json.gz"
+        meta_path = self.cache_dir / f"{cache_key}.meta.json"
+
+        meta = {}
+        if body_path.exists() and meta_path.exists():
+            with open(meta_path) as f:
+                meta = json.load(f)
+            fetched_at = datetime.fromisoformat(meta["fetched_at"])
+            historical = (
+                datetime.now() - datetime.fromisoformat(end_date)
+                > self.HISTORICAL_AGE
+            )
+            if historical or datetime.now() - fetched_at < self.CACHE_MAX_AGE:
+                self._log("✅ Using cached USGS response")
+                with open(body_path, "rb") as f:
+                    return _json_loads(gzip.decompress(f.read()))
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        # Transient failures are retried with backoff by the session adapter.
+        response = self._session.get(
+            self.USGS_API_BASE, params=params, headers=headers, timeout=10
+        )
+        response.raise_for_status()
+
+        if response.status_code == 304:
+            self._log("✅ USGS response not modified, using cache")
+            with open(body_path, "rb") as f:
+                body = gzip.decompress(f.read())
+        else:
+            body = response.content
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(body_path, gzip.compress(body))
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
 
-            data = response.json()
-            self._log(f"✅ Retrieved {len(data.get('features', []))} earthquakes")
+        meta["fetched_at"] = datetime.now().isoformat()
+        _atomic_write(meta_path, json.dumps(meta).encode())
 
-            return data
+        data = _json_loads(body)
+        self._log(f"✅ Retrieved {len(data.get('features', []))} earthquakes")
 
-        except requests.exceptions.RequestException as e:
-            self._log(f"❌ Error fetching from USGS API: {e}")
-            raise
+        return data
 
     # Mock data generation methods removed to ensure production integrity.
     # No _load_sample_data or _create_mock_data available.
 
-    def process_for_analysis(self, earthquake_data: Dict) -> List[Dict]:
+    def process_for_analysis(
+        self, earthquake_data: Dict, cache_key: Optional[str] = None
+    ) -> List[Dict]:
         """
         Process USGS GeoJSON data into analysis format.
+
+        Args:
+            earthquake_data: GeoJSON as returned by ``fetch_earthquakes``
+            cache_key: Identifies the query ``earthquake_data`` came from.
+                When given, the result is memoized under
+                ``cache_dir/processed``: one pickle per query, tagged with the
+                features' ids and update times and the processing code, and
+                replaced once the query returns a different catalog.
         """
-        processed = []
+        if cache_key is None:
+            return self._process_features(earthquake_data)
 
+        query_key = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
+        digest = hashlib.sha256()
         for feature in earthquake_data.get("features", []):
-            props = feature.get("properties", {})
-            coords = feature.get("geometry", {}).get("coordinates", [])
-
-            # Convert timestamp (milliseconds) to datetime
-            timestamp_ms = props.get("time", 0)
-            eq_date = datetime.fromtimestamp(timestamp_ms / 1000)
-
-            processed_eq = {
-                "date": eq_date.strftime("%Y-%m-%d"),
-                "time": eq_date.isoformat(),
-                "magnitude": float(
-                    self._homogenize_magnitude(
-                        props.get("mag", 0), props.get("magType", "")
-                    )
-                ),
-                "magnitude_raw": props.get("mag", 0),
-                "magnitude_type": props.get("magType", ""),
-                "place": props.get("place", "Unknown"),
-                "latitude": coords[1] if len(coords) > 1 else 0,
-                "longitude": coords[0] if len(coords) > 0 else 0,
-                "depth_km": coords[2] if len(coords) > 2 else 0,
-                "usgs_url": props.get("url", ""),
+            updated = feature.get("properties", {}).get("updated")
+            digest.update(f"{feature.get('id')}:{updated};".encode())
+        for method in (self._process_features, self._homogenize_magnitude_array):
+            digest.update(inspect.getsource(method).encode())
+        processed_dir = self.cache_dir / "processed"
+        cache_path = processed_dir / f"{query_key}_{digest.hexdigest()[:16]}.pkl"
+
+        if cache_path.exists():
+            self._log("✅ Using cached processed catalog")
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+
+        processed = self._process_features(earthquake_data)
+        # Drop this query's earlier snapshot before writing the new one.
+        processed_dir.mkdir(parents=True, exist_ok=True)
+        for stale in processed_dir.glob(f"{query_key}_*.pkl"):
+            stale.unlink(missing_ok=True)
+        _atomic_write(
+            cache_path, pickle.dumps(processed, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        return processed
+
+    def _process_features(self, earthquake_data: Dict) -> List[Dict]:
+        """Convert GeoJSON features into the flat analysis records."""
+        features = earthquake_data.get("features", [])
+        n = len(features)
+
+        # Pull each field out once, then build the output column-wise.
+        props = [feature.get("properties", {}) for feature in features]
+        coords = np.array(
+            [
+                (list(f.get("geometry", {}).get("coordinates", [])) + [0, 0, 0])[:3]
+                for f in features
+            ],
+            dtype=np.float64,
+        ).reshape(n, 3)
+
+        # USGS times are epoch milliseconds (UTC)
+        times_ms = np.fromiter((p.get("time", 0) for p in props), np.int64, n)
+        eq_times = times_ms.astype("datetime64[ms]")
+
+        # Missing or null magnitudes become 0.0; the dtype does the cast.
+        mags = np.fromiter((p.get("mag") or 0.0 for p in props), np.float64, n)
+        mag_types = [p.get("magType") or "" for p in props]
+        magnitude = self._homogenize_magnitude_array(
+            mags, np.array(mag_types, dtype=str)
+        )
+
+        df = pd.DataFrame(
+            {
+                "date": np.datetime_as_string(eq_times, unit="D"),
+                "time": np.datetime_as_string(eq_times, unit="ms"),
+                "time_ms": times_ms,
+                "magnitude": magnitude,
+                "magnitude_raw": mags,
+                "magnitude_type": mag_types,
+                "place": [p.get("place", "Unknown") for p in props],
+                "latitude": coords[:, 1],
+                "longitude": coords[:, 0],
+                "depth_km": coords[:, 2],
+                "usgs_url": [p.get("url", "") for p in props],
             }
-            processed.append(processed_eq)
+        )
 
-        return processed
+        return df.to_dict(orient="records")
 
     def _homogenize_magnitude(self, mag: float, mag_type: str) -> float:
         """
         Homogenize magnitude to Mw.
         """
-        if not mag_type:
-            return mag
-
-        mt = mag_type.lower()
-        if mt in ("mw", "mww", "mwr", "mwc"):
-            return mag
-
-        if mt == "mb":
-            if mag > 6.0:
-                return 0.85 * mag + 1.03
-            return mag
+        return float(
+            self._homogenize_magnitude_array(
+                np.array([mag], dtype=np.float64), np.array([mag_type or ""])
+            )[0]
+        )
 
-        if mt == "ms":
-            if 3.0 <= mag <= 6.1:
-                return 0.67 * mag + 2.07
-            elif mag > 6.1:
-                return 0.99 * mag + 0.08
+    def _homogenize_magnitude_array(
+        self, mags: np.ndarray, mag_types: np.ndarray
+    ) -> np.ndarray:
+        """
+        Homogenize arrays of magnitudes to Mw.
 
-        return mag
+        mb above 6.0 and Ms in 3.0-6.1 / above 6.1 are converted with the
+        Scordilis (2006) relations; every other type is returned unchanged.
+        """
+        mags = np.asarray(mags, dtype=np.float64)
+        mt = np.char.lower(np.asarray(mag_types).astype(str))
+
+        is_mb = mt == "mb"
+        is_ms = mt == "ms"
+
+        return np.select(
+            [
+                is_mb & (mags > 6.0),
+                is_ms & (mags >= 3.0) & (mags <= 6.1),
+                is_ms & (mags > 6.1),
+            ],
+            [
+                0.85 * mags + 1.03,
+                0.67 * mags + 2.07,
+                0.99 * mags + 0.08,
+            ],
+            default=mags,
+        )
 
     def decluster_catalog(self, catalog: List[Dict]) -> List[Dict]:
         """
         Decluster the earthquake catalog using Gardner-Knopoff algorithm.
+
+        Args:
+            catalog: Records as produced by ``process_for_analysis``. Event
+                times are read from ``time_ms`` (epoch milliseconds, UTC);
+                records without it must carry ``time`` as an ISO-8601 UTC
+                string, which is converted for all such records in one
+                batch. Datetime objects are accepted there too.
+
+        Returns:
+            The independent (mainshock) records, largest magnitude first.
         """
+        catalog = list(catalog)
         self._log(f"Declustering {len(catalog)} events...")
-        
-        events = []
-        for eq in catalog:
-            if isinstance(eq["time"], str):
-                try:
-                    dt = datetime.fromisoformat(eq["time"].replace("Z", "+00:00"))
-                except ValueError:
-                    dt = datetime.strptime(eq["time"][:10], "%Y-%m-%d")
-            else:
-                dt = eq["time"]
-
-            events.append(
-                {
-                    "data": eq,
-                    "magnitude": float(eq["magnitude"]),
-                    "time": dt,
-                    "lat": float(eq["latitude"]),
-                    "lon": float(eq["longitude"]),
-                    "id": eq.get("usgs_url", str(hash(str(eq)))),
-                }
+        if len(catalog) < 2:
+            return catalog
+
+        # Hold the catalog as parallel arrays (structure of arrays) so each
+        # mainshock's aftershock search is a handful of vectorized passes.
+        n = len(catalog)
+        mags = np.fromiter((eq["magnitude"] for eq in catalog), np.float64, n)
+        lats = np.fromiter((eq["latitude"] for eq in catalog), np.float64, n)
+        lons = np.fromiter((eq["longitude"] for eq in catalog), np.float64, n)
+
+        # process_for_analysis keeps the raw USGS epoch milliseconds; only
+        # records from other sources have their time strings parsed, in bulk.
+        time_ms = [eq.get("time_ms") for eq in catalog]
+        missing = [k for k, value in enumerate(time_ms) if value is None]
+        if missing:
+            parsed = _to_epoch_ms([catalog[k]["time"] for k in missing])
+            for k, value in zip(missing, parsed):
+                time_ms[k] = value
+        times = np.array(time_ms, dtype=np.int64)
+
+        # Largest first; a stable sort keeps input order among equal magnitudes.
+        order = np.argsort(-mags, kind="stable")
+        mags, lats, lons, times = mags[order], lats[order], lons[order], times[order]
+
+        # Events are identified by their position in the sorted arrays; a
+        # bytearray keeps the removal flags at one byte per event.
+        removed = bytearray(len(order))
+
+        # Gardner-Knopoff window for every event, as one vectorized lookup.
+        # Magnitudes below the table are given the smallest window.
+        window_idx = np.clip(
+            np.searchsorted(_GK_MAGS, mags, side="right") - 1, 0, len(_GK_MAGS) - 1
+        )
+        dist_km = _GK_WINDOWS[window_idx, 0].astype(np.float32)
+
+        # Time windows as int64 milliseconds so the window test is one
+        # vectorized integer comparison per mainshock.
+        window_ms = (_GK_WINDOWS[window_idx, 1] * MS_PER_DAY).astype(np.int64)
+
+        lat_rad = np.radians(lats.astype(np.float32))
+        lon_rad = np.radians(lons.astype(np.float32))
+        cos_lat = np.cos(lat_rad)
+
+        # Zero-copy NumPy view of the bitmap for vectorized reads and writes.
+        removed_view = np.frombuffer(removed, dtype=np.uint8)
+
+        max_dlat, max_dlon = _angular_bounds(lat_rad, cos_lat, dist_km)
+
+        # Time-sorted index: each mainshock's time window becomes a
+        # contiguous slice found by binary search.
+        time_order = np.argsort(times, kind="stable")
+        times_sorted = times[time_order]
+
+        if NUMBA_AVAILABLE:
+            _decluster_kernel(
+                lat_rad,
+                lon_rad,
+                cos_lat,
+                times,
+                dist_km,
+                window_ms,
+                max_dlat,
+                max_dlon,
+                time_order,
+                times_sorted,
+                removed_view,
             )
-
-        events.sort(key=lambda x: x["magnitude"], reverse=True)
-
-        independent_events = []
-        removed_ids = set()
-
-        gk_windows = {
-            2.5: [19.5, 6],
-            3.0: [22.5, 11.5],
-            3.5: [26, 22],
-            4.0: [30, 42],
-            4.5: [35, 83],
-            5.0: [40, 155],
-            5.5: [47, 290],
-            6.0: [54, 510],
-            6.5: [61, 790],
-            7.0: [70, 915],
-            7.5: [81, 960],
-            8.0: [94, 985],
-        }
-
-        def get_window(mag):
-            keys = sorted(gk_windows.keys())
-            for k in reversed(keys):
-                if mag >= k:
-                    return gk_windows[k]
-            return gk_windows[2.5]
-
-        from math import radians, cos, sin, asin, sqrt
-
-        def haversine(lat1, lon1, lat2, lon2):
-            R = 6371
-            dLat = radians(lat2 - lat1)
-            dLon = radians(lon2 - lon1)
-            a = (
-                sin(dLat / 2) ** 2
-                + cos(radians(lat1)) * cos(radians(lat2)) * sin(dLon / 2) ** 2
+        elif SKLEARN_AVAILABLE:
+            # One batched radius query finds every event's spatial neighbours;
+            # the sequential pass then only applies time and removal filters.
+            points = np.radians(np.column_stack([lats, lons]))
+            neighbours = BallTree(points, metric="haversine").query_radius(
+                points, r=dist_km.astype(np.float64) / float(EARTH_RADIUS_KM)
             )
-            c = 2 * asin(sqrt(a))
-            return R * c
-
-        for i, mainshock in enumerate(events):
-            if mainshock["id"] in removed_ids:
-                continue
-
-            independent_events.append(mainshock["data"])
-            dist_km, time_days = get_window(mainshock["magnitude"])
-
-            for j in range(i + 1, len(events)):
-                candidate = events[j]
-                if candidate["id"] in removed_ids:
+            for i in range(len(order)):
+                if removed[i]:
+                    continue
+                candidates = neighbours[i]
+                candidates = candidates[
+                    (candidates > i)
+                    & (removed_view[candidates] == 0)
+                    & (np.abs(times[candidates] - times[i]) <= window_ms[i])
+                ]
+                removed_view[candidates] = 1
+        else:
+            for i in range(len(order)):
+                if removed[i]:
                     continue
 
-                time_diff = abs((candidate["time"] - mainshock["time"]).days)
-                if time_diff > time_days:
+                lo = np.searchsorted(times_sorted, times[i] - window_ms[i], "left")
+                hi = np.searchsorted(times_sorted, times[i] + window_ms[i], "right")
+                candidates = time_order[lo:hi]
+                candidates = candidates[
+                    (candidates > i) & (removed_view[candidates] == 0)
+                ]
+
+                # Cheap bounding-box rejection before the trigonometry.
+                dlon = np.abs(lon_rad[candidates] - lon_rad[i])
+                dlon = np.minimum(dlon, np.float32(2 * np.pi) - dlon)
+                candidates = candidates[
+                    (np.abs(lat_rad[candidates] - lat_rad[i]) <= max_dlat[i])
+                    & (dlon <= max_dlon[i])
+                ]
+                if candidates.size == 0:
                     continue
 
-                dist = haversine(
-                    mainshock["lat"],
-                    mainshock["lon"],
-                    candidate["lat"],
-                    candidate["lon"],
+                dist = _haversine_km(
+                    lat_rad[i],
+                    lon_rad[i],
+                    cos_lat[i],
+                    lat_rad[candidates],
+                    lon_rad[candidates],
+                    cos_lat[candidates],
                 )
-                if dist <= dist_km:
-                    removed_ids.add(candidate["id"])
+                removed_view[candidates[dist <= dist_km[i]]] = 1
+
+        independent_events = [catalog[k] for k in order[removed_view == 0]]
 
         self._log(
             f"Declustering complete. Reduced from {len(catalog)} to {len(independent_events)} events."
         )
         return independent_events
 
-    def save_to_file(self, earthquakes: List[Dict], output_path: str) -> None:
-        """Save processed earthquakes to JSON file."""
+    def save_to_file(
+        self, earthquakes: List[Dict], output_path: str, pretty: bool = False
+    ) -> None:
+        """
+        Save processed earthquakes to JSON file.
+
+        Records are serialized and written one at a time as a compact JSON
+        array; ``pretty=True`` writes the whole list with two-space indents.
+        """
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(earthquakes, f, indent=2)
+        with open(output_path, "wb") as f:
+            if pretty:
+                f.write(_json_dumps(earthquakes, indent=True))
+            else:
+                f.write(b"[")
+                for i, eq in enumerate(earthquakes):
+                    if i:
+                        f.write(b",\n")
+                    f.write(_json_dumps(eq))
+                f.write(b"]\n")
         self._log(f"✅ Saved {len(earthquakes)} earthquakes to {output_path}")
 
+    def save_ndjson(self, records: List[Dict], output_path: Path) -> None:
+        """
+        Save records as newline-delimited JSON (one compact object per line).
+
+        NDJSON files can be streamed line by line without loading the
+        whole array, and are roughly half the size of ``indent=2`` output.
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            for record in records:
+                f.write(_json_dumps(record))
+                f.write(b"\n")
+        self._log(f"✅ Saved {len(records)} earthquakes to {output_path}")
+
+    def save_parquet(self, records: List[Dict], output_path: Path) -> None:
+        """
+        Save records as a zstd-compressed Parquet table (requires pyarrow).
+
+        Parquet is several times smaller than JSON and loads column-wise
+        straight into pandas/NumPy in later analysis stages.
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame.from_records(records).to_parquet(
+            output_path, compression="zstd", index=False
+        )
+        self._log(f"✅ Saved {len(records)} earthquakes to {output_path}")
+
     def _log(self, message: str) -> None:
         """Print log message if verbose mode is enabled."""
         if self.verbose:
@@ -316,47 +872,57 @@ def main():
     base_dir = Path(__file__).parent.parent / "data"
     base_dir.mkdir(parents=True, exist_ok=True)
     
-    try:
-        # ---------------------------------------------------------
+    datasets = [
         # DATASET 1: Global Significant Earthquakes (Mag 6.0+)
-        # ---------------------------------------------------------
-        print("\n1. Fetching Global Data (2020-2025, Mag 6.0+)...")
-        global_data = fetcher.fetch_earthquakes(
-            start_date="2020-01-01",
-            end_date="2025-12-31", 
-            min_magnitude=6.0,
-            use_usgs_api=True
-        )
-        
-        global_file = base_dir / "usgs_global_6plus_2020_2025.json"
-        processed_global = fetcher.process_for_analysis(global_data)
-        
-        with open(global_file, "w") as f:
-            json.dump(processed_global, f, indent=2, default=str)
-        print(f"   ✅ Saved {len(processed_global)} records to {global_file.name}")
-
-
-        # ---------------------------------------------------------
+        {
+            "label": "Global Data (2020-2025, Mag 6.0+)",
+            "start_date": "2020-01-01",
+            "end_date": "2025-12-31",
+            "min_magnitude": 6.0,
+            "output_stem": base_dir / "usgs_global_6plus_2020_2025",
+        },
         # DATASET 2: Indian Subcontinent (Mag 5.0+)
-        # ---------------------------------------------------------
         # Region: roughly 5N-40N, 60E-100E
-        print("\n2. Fetching Indian Subcontinent Data (2020-2025, Mag 5.0+)...")
-        india_data = fetcher.fetch_earthquakes(
-            start_date="2020-01-01",
-            end_date="2025-12-31", 
-            min_magnitude=5.0,
-            latitude_range=(5.0, 40.0),
-            longitude_range=(60.0, 100.0),
-            use_usgs_api=True
+        {
+            "label": "Indian Subcontinent Data (2020-2025, Mag 5.0+)",
+            "start_date": "2020-01-01",
+            "end_date": "2025-12-31",
+            "min_magnitude": 5.0,
+            "latitude_range": (5.0, 40.0),
+            "longitude_range": (60.0, 100.0),
+            "output_stem": base_dir / "usgs_india_5plus_2020_2025",
+        },
+    ]
+
+    def _fetch_and_save(spec: Dict) -> Path:
+        data = fetcher.fetch_earthquakes(
+            start_date=spec["start_date"],
+            end_date=spec["end_date"],
+            min_magnitude=spec["min_magnitude"],
+            latitude_range=spec.get("latitude_range"),
+            longitude_range=spec.get("longitude_range"),
+            use_usgs_api=True,
         )
-        
-        india_file = base_dir / "usgs_india_5plus_2020_2025.json"
-        processed_india = fetcher.process_for_analysis(india_data)
-        
-        with open(india_file, "w") as f:
-            json.dump(processed_india, f, indent=2, default=str)
-        print(f"   ✅ Saved {len(processed_india)} records to {india_file.name}")
+        processed = fetcher.process_for_analysis(
+            data, cache_key=spec["output_stem"].name
+        )
+        # Parquet when pyarrow is installed; NDJSON otherwise.
+        if PYARROW_AVAILABLE:
+            output_file = spec["output_stem"].with_suffix(".parquet")
+            fetcher.save_parquet(processed, output_file)
+        else:
+            output_file = spec["output_stem"].with_suffix(".ndjson")
+            fetcher.save_ndjson(processed, output_file)
+        print(f"   ✅ Saved {len(processed)} records to {output_file.name}")
+        return output_file
 
+    try:
+        # Both datasets are network-bound and independent, so fetch them
+        # concurrently over the shared session.
+        for i, spec in enumerate(datasets, 1):
+            print(f"\n{i}. Fetching {spec['label']}...")
+        with ThreadPoolExecutor(max_workers=len(datasets)) as pool:
+            global_file, india_file = pool.map(_fetch_and_save, datasets)
 
         print("\n" + "="*80)
         print("STORAGE COMPLETE")
@@ -7,9 +7,13 @@ Data-driven approach to analyze if certain planetary combinations
 Part of the multi-use-case validation system for planetary influence analysis.
 """
 
+import hashlib
+import inspect
 import json
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
@@ -22,6 +26,73 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.
 
 from vedic_astrology_core.astrology.ephemeris import EphemerisEngine
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for pandas)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _conjunction_runs(separation: np.ndarray, threshold_deg: float) -> np.ndarray:
+    """
+    Return (start, end) sample indices of each run where the angular
+    separation is within ``threshold_deg``.
+    """
+    # Pad with False so every run has a rising and a falling edge.
+    is_conjunct = np.concatenate(([False], separation <= threshold_deg, [False]))
+    edges = np.diff(is_conjunct.astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+
+    return np.column_stack([starts, ends])
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _conjunction_runs_kernel(separation, threshold_deg):
+        """Single-pass compiled version of ``_conjunction_runs``."""
+        runs = np.empty((len(separation), 2), dtype=np.int64)
+        n_runs = 0
+        start = -1
+
+        for i in range(len(separation)):
+            if separation[i] <= threshold_deg:
+                if start < 0:
+                    start = i
+            elif start >= 0:
+                runs[n_runs, 0] = start
+                runs[n_runs, 1] = i - 1
+                n_runs += 1
+                start = -1
+
+        if start >= 0:
+            runs[n_runs, 0] = start
+            runs[n_runs, 1] = len(separation) - 1
+            n_runs += 1
+
+        return runs[:n_runs]
+
+
+def _planet_positions_chunk(jds: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+    """Batched planet positions for one slice of Julian Days (worker process)."""
+    return EphemerisEngine().get_all_planet_positions_batch(jds)
+
 
 class EarthquakeAstrologicalAnalysis:
     """
@@ -34,12 +105,37 @@ class EarthquakeAstrologicalAnalysis:
     - Planetary transits → Seismic activity?
     """
 
-    def __init__(self, earthquake_data_file: Optional[str] = None):
-        """Initialize earthquake analysis framework."""
+    # Minimum dates per worker before ephemeris generation is split across
+    # processes; smaller ranges are not worth the process start-up cost.
+    MIN_DATES_PER_WORKER = 500
+
+    def __init__(self, earthquake_data_file: Optional[str] = None,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialize earthquake analysis framework.
+
+        Args:
+            earthquake_data_file: Earthquake catalog (CSV, JSON, NDJSON or Parquet)
+            cache_dir: Directory for cached planetary data
+                (defaults to use_cases/earthquake/data/planetary_cache)
+        """
         self.earthquakes = self._load_earthquake_data(earthquake_data_file)
+        # Event times as one datetime64[ns] array, shared by the analyses
+        self._eq_times = self.earthquakes["datetime"].values.astype("datetime64[ns]")
+        self.cache_dir = cache_dir or os.path.abspath(
+            os.path.join(os.path.dirname(__file__), '../data/planetary_cache')
+        )
         self.planetary_data = None
         self.correlation_results = {}
 
+        # NumPy copies of planetary_data columns and per-pair separations,
+        # valid while planetary_data is the _arrays_source frame
+        self._arrays_source = None
+        self._np_dates = None
+        self._np_pos = {}
+        self._np_strength = {}
+        self._separation_cache = {}
+
         # Define planetary combinations to test
         self.COMBINATIONS_TO_TEST = {
             "mangal_ketu": {
@@ -80,7 +176,7 @@ class EarthquakeAstrologicalAnalysis:
         
         Expected format:
         date,time,latitude,longitude,magnitude,depth_km,location
-        OR JSON list of objects.
+        OR JSON list of objects, OR NDJSON (one object per line), OR Parquet.
         """
         if not filename or not os.path.exists(filename):
             raise FileNotFoundError(
@@ -89,15 +185,26 @@ class EarthquakeAstrologicalAnalysis:
                 "or other valid dataset."
             )
 
-        if filename.endswith('.json'):
-            df = pd.read_json(filename)
+        if filename.endswith(('.json', '.ndjson', '.parquet')):
+            if filename.endswith('.parquet'):
+                df = pd.read_parquet(filename)
+            elif ORJSON_AVAILABLE:
+                with open(filename, 'rb') as f:
+                    if filename.endswith('.ndjson'):
+                        records = [orjson.loads(line) for line in f if line.strip()]
+                    else:
+                        records = orjson.loads(f.read())
+                df = pd.DataFrame(records)
+            else:
+                df = pd.read_json(filename, lines=filename.endswith('.ndjson'))
             # Ensure datetime format matches analysis expectations
             if 'time' in df.columns:
-                 # Fetcher saves 'time' as ISO string or timestamp
-                # Use format='mixed' to handle both with and without microseconds
-                df['datetime'] = pd.to_datetime(df['time'], format='mixed')
+                # Fetcher saves 'time' as an offset-free ISO-8601 UTC string;
+                # format='ISO8601' accepts it with or without fractional seconds
+                # and parses in a single pass instead of guessing per element.
+                df['datetime'] = pd.to_datetime(df['time'], format='ISO8601', cache=True)
             elif 'date' in df.columns:
-                df['datetime'] = pd.to_datetime(df['date'], format='mixed')
+                df['datetime'] = pd.to_datetime(df['date'], format='ISO8601', cache=True)
         else:
             df = pd.read_csv(filename)
             df['datetime'] = pd.to_datetime(df['date'] + ' ' + df['time'].astype(str))
@@ -109,6 +216,10 @@ class EarthquakeAstrologicalAnalysis:
                                frequency: str = 'daily') -> pd.DataFrame:
         """
         Generate REAL planetary position/strength data using Swiss Ephemeris.
+
+        Results are cached under ``cache_dir`` (Parquet when pyarrow is
+        installed, pickle otherwise), keyed by the date range, frequency and
+        the generating code, so repeated runs skip the ephemeris calls.
         
         Args:
             start_date: Start of analysis period
@@ -118,6 +229,42 @@ class EarthquakeAstrologicalAnalysis:
         Returns:
             DataFrame with planetary positions
         """
+        digest = hashlib.sha256(
+            f"{start_date.isoformat()}|{end_date.isoformat()}|{frequency}".encode()
+        )
+        for method in (self._compute_planetary_data,
+                       EphemerisEngine.get_all_planet_positions_batch):
+            digest.update(inspect.getsource(method).encode())
+        suffix = '.parquet' if PYARROW_AVAILABLE else '.pkl'
+        cache_path = os.path.join(self.cache_dir, f"planetary_{digest.hexdigest()}{suffix}")
+
+        if os.path.exists(cache_path):
+            print(f"Using cached planetary data from {cache_path}")
+            if PYARROW_AVAILABLE:
+                self.planetary_data = pd.read_parquet(cache_path)
+            else:
+                self.planetary_data = pd.read_pickle(cache_path)
+            return self.planetary_data
+
+        self.planetary_data = self._compute_planetary_data(start_date, end_date, frequency)
+
+        if not self.planetary_data.empty:
+            # Write to a temporary file first so an interrupted run never
+            # leaves a truncated cache entry behind.
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            if PYARROW_AVAILABLE:
+                self.planetary_data.to_parquet(tmp_path, compression='zstd', index=False)
+            else:
+                self.planetary_data.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+
+        return self.planetary_data
+
+    def _compute_planetary_data(self, start_date: datetime,
+                                end_date: datetime,
+                                frequency: str) -> pd.DataFrame:
+        """Compute planetary positions with Swiss Ephemeris (uncached)."""
         print(f"Generating planetary data from {start_date.date()} to {end_date.date()}...")
         
         # Initialize Ephemeris Engine
@@ -135,31 +282,74 @@ class EarthquakeAstrologicalAnalysis:
         else:
             dates = pd.date_range(start_date, end_date, freq='MS')
         
-        rows = []
-        
-        for date_val in dates:
-            # Calculate at Noon to be consistent
-            dt = datetime.combine(date_val.date(), datetime.min.time().replace(hour=12))
-            
-            # Get Julian Day
-            jd = ephemeris.datetime_to_julian_day(dt)
-            
-            # Get all positions
-            positions = ephemeris.get_all_planet_positions(jd)
-            
-            row = {'datetime': date_val}
-            
-            for planet, data in positions.items():
-                # Store longitude (0-360)
-                p_name = planet.upper()
-                row[f'{p_name}_position'] = data['longitude']
-                row[f'{p_name}_speed'] = data['longitude_speed']
-                row[f'{p_name}_strength'] = 50.0 # Placeholder
-            
-            rows.append(row)
-        
-        self.planetary_data = pd.DataFrame(rows)
-        return self.planetary_data
+        # Calculate at Noon to be consistent; the Unix epoch is JD 2440587.5
+        noon = dates.normalize() + pd.Timedelta(hours=12)
+        jds = ((noon - pd.Timestamp('1970-01-01')) / pd.Timedelta(days=1)).to_numpy() + 2440587.5
+
+        # All positions for every date in batched calls, as columns. Dates are
+        # independent, so long ranges are split over one process per core.
+        workers = min(os.cpu_count() or 1, len(jds) // self.MIN_DATES_PER_WORKER)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_planet_positions_chunk, np.array_split(jds, workers)))
+            positions = {
+                planet: {
+                    field: np.concatenate([part[planet][field] for part in parts])
+                    for field in fields
+                }
+                for planet, fields in parts[0].items()
+            }
+        else:
+            positions = ephemeris.get_all_planet_positions_batch(jds)
+
+        columns = {'datetime': dates}
+        for planet, data in positions.items():
+            # Store longitude (0-360)
+            p_name = planet.upper()
+            columns[f'{p_name}_position'] = data['longitude']
+            columns[f'{p_name}_speed'] = data['longitude_speed']
+            columns[f'{p_name}_strength'] = np.full(len(dates), 50.0)  # Placeholder
+
+        return pd.DataFrame(columns)
+
+    def _sync_planetary_arrays(self) -> None:
+        """
+        Extract the sample dates, planet longitudes and strengths of
+        ``planetary_data`` into NumPy arrays once, redoing it only when the
+        frame is replaced (edit a copy rather than the frame in place).
+        """
+        if self._arrays_source is self.planetary_data:
+            return
+
+        df = self.planetary_data
+        self._np_dates = df["datetime"].values
+        self._np_pos = {
+            col[: -len("_position")]: df[col].to_numpy(dtype=np.float64)
+            for col in df.columns
+            if col.endswith("_position")
+        }
+        self._np_strength = {
+            col[: -len("_strength")]: df[col].to_numpy(dtype=np.float64)
+            for col in df.columns
+            if col.endswith("_strength")
+        }
+        self._separation_cache = {}
+        self._arrays_source = df
+
+    def _angular_separation(self, planet1: str, planet2: str) -> np.ndarray:
+        """
+        Wrap-around separation (0-180 degrees) of two planets for every sample.
+
+        Memoized per unordered planet pair for the current ``planetary_data``.
+        """
+        self._sync_planetary_arrays()
+
+        key = frozenset((planet1, planet2))
+        if key not in self._separation_cache:
+            diff = np.abs(self._np_pos[planet1] - self._np_pos[planet2])
+            self._separation_cache[key] = np.where(diff > 180, 360 - diff, diff)
+
+        return self._separation_cache[key]
 
     def identify_planetary_conjunction(
         self, planet1: str, planet2: str, tolerance_deg: float = 8.0
@@ -170,21 +360,11 @@ class EarthquakeAstrologicalAnalysis:
         if self.planetary_data is None:
             return []
 
-        pos1 = self.planetary_data[f"{planet1}_position"].values
-        pos2 = self.planetary_data[f"{planet2}_position"].values
-        dates = self.planetary_data["datetime"].values
-
-        conjunctions = []
-
-        for i in range(len(pos1)):
-            diff = abs(pos1[i] - pos2[i])
-            if diff > 180:
-                diff = 360 - diff
+        diff = self._angular_separation(planet1, planet2)
+        dates = self._np_dates
+        idx = np.flatnonzero(diff <= tolerance_deg)
 
-            if diff <= tolerance_deg:
-                conjunctions.append((dates[i], diff))
-
-        return conjunctions
+        return list(zip(dates[idx], diff[idx]))
 
     def analyze_conjunction_earthquake_correlation(
         self, planet1: str, planet2: str, window_days: int = 30
@@ -197,35 +377,42 @@ class EarthquakeAstrologicalAnalysis:
             return {"status": "no_conjunctions_found", "details": {}}
 
         conjunction_dates = [c[0] for c in conjunctions]
-        earthquakes_near_conjunction = 0
-        earthquakes_far_from_conjunction = 0
-        total_earthquake_days = 0
-
-        for eq_date in self.earthquakes["datetime"].values:
-            near_conjunction = False
-            for conj_date in conjunction_dates:
-                conj_datetime = pd.Timestamp(conj_date)
-                eq_datetime = pd.Timestamp(eq_date)
-                days_diff = abs((eq_datetime - conj_datetime).days)
 
-                if days_diff <= window_days:
-                    earthquakes_near_conjunction += 1
-                    near_conjunction = True
-                    break
-
-            if not near_conjunction:
-                earthquakes_far_from_conjunction += 1
-
-            total_earthquake_days += 1
+        # An earthquake is near a conjunction when abs((eq - conj).days) is
+        # within window_days. Timedelta.days floors, so each conjunction covers
+        # [conj - window_days days, conj + (window_days + 1) days). Conjunctions
+        # come in runs of consecutive days, so their windows are merged into
+        # disjoint intervals before testing and measuring coverage.
+        conj_times = np.sort(np.asarray(conjunction_dates, dtype="datetime64[ns]"))
+        day = np.timedelta64(1, "D")
+        lo = conj_times - window_days * day
+        hi = conj_times + (window_days + 1) * day
+        new_run = np.concatenate(([True], lo[1:] > hi[:-1]))
+        merged_lo = lo[new_run]
+        merged_hi = hi[np.concatenate((new_run[1:], [True]))]
+
+        # First merged interval ending after each earthquake; near if it has begun
+        pos = np.searchsorted(merged_hi, self._eq_times, side="right")
+        inside = pos < len(merged_hi)
+        near = np.zeros(len(self._eq_times), dtype=bool)
+        near[inside] = merged_lo[pos[inside]] <= self._eq_times[inside]
+
+        earthquakes_near_conjunction = int(near.sum())
+        earthquakes_far_from_conjunction = len(near) - earthquakes_near_conjunction
 
         total_period_days = (
             self.earthquakes["datetime"].max() - self.earthquakes["datetime"].min()
         ).days
 
+        # Expected count under a uniform rate: the share of the analysis period
+        # covered by the union of windows (overlaps are counted once).
+        period_start, period_end = self._eq_times.min(), self._eq_times.max()
+        covered_days = (
+            np.clip(merged_hi, period_start, period_end)
+            - np.clip(merged_lo, period_start, period_end)
+        ).sum() / day
         expected_earthquakes_in_window = (
-            len(self.earthquakes)
-            * (len(conjunction_dates) * window_days * 2)
-            / total_period_days
+            len(self.earthquakes) * covered_days / ((period_end - period_start) / day)
         )
 
         chi_square = (
@@ -246,6 +433,7 @@ class EarthquakeAstrologicalAnalysis:
             ),
             "chi_square_statistic": round(chi_square, 4),
             "window_days": window_days,
+            "window_coverage_days": round(float(covered_days), 2),
             "total_earthquakes": len(self.earthquakes),
             "analysis_period_days": total_period_days,
         }
@@ -259,28 +447,26 @@ class EarthquakeAstrologicalAnalysis:
         if self.planetary_data is None:
             return {"status": "no_planetary_data"}
 
-        high_strength_mask = (
-            self.planetary_data[f"{planet}_strength"] >= strength_threshold
-        )
-        high_strength_dates = self.planetary_data[high_strength_mask]["datetime"].values
+        self._sync_planetary_arrays()
+        high_strength_mask = self._np_strength[planet] >= strength_threshold
 
-        if len(high_strength_dates) == 0:
+        if not high_strength_mask.any():
             return {"status": "no_high_strength_periods"}
 
-        earthquakes_during_high_strength = 0
-        earthquakes_during_low_strength = 0
+        # Nearest planetary sample for every earthquake by binary search over
+        # the (sorted) sample dates; ties go to the earlier sample like argmin.
+        sample_times = self._np_dates.astype("datetime64[ns]").view("i8")
+        eq_times = self._eq_times.view("i8")
+        right = np.clip(np.searchsorted(sample_times, eq_times), 0, len(sample_times) - 1)
+        left = np.maximum(right - 1, 0)
+        closer_right = np.abs(sample_times[right] - eq_times) < np.abs(sample_times[left] - eq_times)
+        closest_idx = np.where(closer_right, right, left)
 
-        for eq_date in self.earthquakes["datetime"].values:
-            eq_dt = pd.Timestamp(eq_date)
-            closest_idx = (self.planetary_data["datetime"] - eq_dt).abs().argmin()
-            is_high_strength = high_strength_mask.iloc[closest_idx]
+        is_high_strength = high_strength_mask[closest_idx]
+        earthquakes_during_high_strength = int(is_high_strength.sum())
+        earthquakes_during_low_strength = len(is_high_strength) - earthquakes_during_high_strength
 
-            if is_high_strength:
-                earthquakes_during_high_strength += 1
-            else:
-                earthquakes_during_low_strength += 1
-
-        total_high_strength_days = high_strength_mask.sum()
+        total_high_strength_days = int(high_strength_mask.sum())
         total_days = len(self.planetary_data)
         high_strength_fraction = total_high_strength_days / total_days
 
@@ -345,8 +531,16 @@ class EarthquakeAstrologicalAnalysis:
 
     def export_results_json(self, output_file: str) -> None:
         """Export analysis results to JSON."""
-        with open(output_file, "w") as f:
-            json.dump(self.correlation_results, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(
+                    self.correlation_results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+                ))
+        else:
+            with open(output_file, "w") as f:
+                json.dump(self.correlation_results, f, indent=2, default=str)
         print(f"Results exported to {output_file}")
 
     def generate_analysis_summary(self) -> str:
@@ -436,33 +630,14 @@ class EarthquakeAstrologicalAnalysis:
         if p1_col not in self.planetary_data.columns or p2_col not in self.planetary_data.columns:
             return []
 
-        pos1 = self.planetary_data[p1_col].values
-        pos2 = self.planetary_data[p2_col].values
-        dates = self.planetary_data['datetime'].values
-        
-        in_conjunction = False
-        start_date = None
-        intervals = []
-        
-        for i, dt in enumerate(dates):
-            diff = abs(pos1[i] - pos2[i])
-            if diff > 180:
-                diff = 360 - diff
-            
-            is_conjunct = diff <= threshold_deg
-            
-            if is_conjunct and not in_conjunction:
-                in_conjunction = True
-                start_date = dt
-            elif not is_conjunct and in_conjunction:
-                in_conjunction = False
-                intervals.append((pd.Timestamp(start_date), pd.Timestamp(dates[i-1])))
-                start_date = None
-                
-        if in_conjunction:
-            intervals.append((pd.Timestamp(start_date), pd.Timestamp(dates[-1])))
-            
-        return intervals
+        separation = self._angular_separation(planet1, planet2)
+        dates = self._np_dates
+
+        if NUMBA_AVAILABLE:
+            runs = _conjunction_runs_kernel(separation, float(threshold_deg))
+        else:
+            runs = _conjunction_runs(separation, threshold_deg)
+        return [(pd.Timestamp(dates[start]), pd.Timestamp(dates[end])) for start, end in runs]
 
     def plot_conjunction_analysis(self, planet1: str, planet2: str, 
                                 threshold_deg: float = 13.0,
@@ -482,27 +657,23 @@ class EarthquakeAstrologicalAnalysis:
             return
 
         dates = self.planetary_data['datetime']
-        pos1 = self.planetary_data[p1_col]
-        pos2 = self.planetary_data[p2_col]
-        
-        diff = np.abs(pos1 - pos2)
-        diff = np.where(diff > 180, 360 - diff, diff)
+        diff = self._angular_separation(planet1, planet2)
         
-        plt.figure(figsize=(15, 8))
-        
-        plt.subplot(2, 1, 1)
-        plt.plot(dates, diff, label=f'{planet1}-{planet2} Separation', color='blue', linewidth=1)
-        plt.axhline(y=threshold_deg, color='red', linestyle='--', label=f'{threshold_deg}° Threshold')
-        plt.fill_between(dates, 0, diff, where=(diff <= threshold_deg), 
+        fig, (ax1, ax2) = plt.subplots(2, 1, sharex=True, figsize=(15, 8))
+
+        # The dense daily series are rasterized so vector exports stay small.
+        ax1.plot(dates, diff, label=f'{planet1}-{planet2} Separation', color='blue',
+                 linewidth=1, rasterized=True)
+        ax1.axhline(y=threshold_deg, color='red', linestyle='--', label=f'{threshold_deg}° Threshold')
+        ax1.fill_between(dates, 0, diff, where=(diff <= threshold_deg),
                          color='red', alpha=0.2, label='Conjunction Period')
-        
-        plt.ylabel('Separation (Degrees)')
-        plt.title(f'{planet1} - {planet2} Conjunction Analysis')
-        plt.legend(loc='upper right')
-        plt.grid(True, alpha=0.3)
-        plt.ylim(0, 180)
-        
-        plt.subplot(2, 1, 2, sharex=plt.gca())
+
+        ax1.set_ylabel('Separation (Degrees)')
+        ax1.set_title(f'{planet1} - {planet2} Conjunction Analysis')
+        ax1.legend(loc='upper right')
+        ax1.grid(True, alpha=0.3)
+        ax1.set_ylim(0, 180)
+
         start_date = dates.min()
         end_date = dates.max()
         eq_subset = self.earthquakes[
@@ -511,35 +682,39 @@ class EarthquakeAstrologicalAnalysis:
         ]
         
         if not eq_subset.empty:
-            scatter = plt.scatter(eq_subset['datetime'], eq_subset['magnitude'], 
-                        s=eq_subset['magnitude']**3 / 10,
-                        c=eq_subset['magnitude'], cmap='viridis', 
-                        alpha=0.7, label='Earthquakes')
-            plt.colorbar(scatter, label='Magnitude')
+            scatter = ax2.scatter(eq_subset['datetime'], eq_subset['magnitude'],
+                                  s=eq_subset['magnitude']**3 / 10,
+                                  c=eq_subset['magnitude'], cmap='viridis',
+                                  alpha=0.7, label='Earthquakes', rasterized=True)
+            fig.colorbar(scatter, ax=ax2, label='Magnitude')
         else:
-            plt.text(0.5, 0.5, "No earthquake data in this period", 
-                     ha='center', transform=plt.gca().transAxes)
+            ax2.text(0.5, 0.5, "No earthquake data in this period",
+                     ha='center', transform=ax2.transAxes)
             
         intervals = self.get_conjunction_intervals(planet1, planet2, threshold_deg)
         for start, end in intervals:
-            plt.axvspan(start, end, color='red', alpha=0.1)
+            ax2.axvspan(start, end, color='red', alpha=0.1)
             
-        plt.ylabel('Magnitude')
-        plt.xlabel('Date')
-        plt.title('Earthquake Events (Red Zones = Conjunction Periods)')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
+        ax2.set_ylabel('Magnitude')
+        ax2.set_xlabel('Date')
+        ax2.set_title('Earthquake Events (Red Zones = Conjunction Periods)')
+        ax2.grid(True, alpha=0.3)
+        fig.tight_layout()
         
         if output_path:
-            plt.savefig(output_path, dpi=300)
+            fig.savefig(output_path, dpi=150)
             print(f"Graph saved to {output_path}")
         else:
             plt.show()
-        plt.close()
+        plt.close(fig)
 
 
 def main():
     """Main analysis workflow."""
+    # Every figure is written to disk here, so use the non-interactive
+    # backend; library callers keep their own backend for plt.show().
+    matplotlib.use('Agg')
+
     print("=" * 80)
     print("EARTHQUAKE-PLANETARY CORRELATION ANALYSIS (SWISS EPHEMERIS)")
     print("Data-driven framework for multi-use-case validation")
@@ -558,6 +733,10 @@ def main():
             
     if not target_file:
         potential_files = [
+            os.path.join(data_dir, "usgs_global_6plus_2020_2025.parquet"),
+            os.path.join(data_dir, "usgs_india_5plus_2020_2025.parquet"),
+            os.path.join(data_dir, "usgs_global_6plus_2020_2025.ndjson"),
+            os.path.join(data_dir, "usgs_india_5plus_2020_2025.ndjson"),
             os.path.join(data_dir, "usgs_global_6plus_2020_2025.json"),
             os.path.join(data_dir, "usgs_india_5plus_2020_2025.json"),
             os.path.join(data_dir, "usgs_real_data_phase7.json")
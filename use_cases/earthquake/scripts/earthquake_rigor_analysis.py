@@ -1,11 +1,15 @@
 import sys
 import os
 import json
+import functools
+import hashlib
+import inspect
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.signal import correlate
 from datetime import datetime, timedelta
-from scipy.stats import pearsonr
 import math
 
 # Add src to path
@@ -15,16 +19,86 @@ sys.path.append(os.path.join(ROOT_DIR, "src"))
 try:
     from vedic_astrology_core.astrology.ephemeris import EphemerisEngine
     from vedic_astrology_core.dignity.global_scorer import GlobalShadbalaScorer
+    from vedic_astrology_core.dignity.scorer import DignityScorer
     from vedic_astrology_core.config.constants import Planet
 except ImportError as e:
     print(f"Error importing core libraries: {e}")
     sys.exit(1)
 
+try:
+    from numpy import trapezoid
+except ImportError:  # NumPy < 2.0
+    from numpy import trapz as trapezoid
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for pandas)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+def _planetary_columns(dates, planets, ee, global_power):
+    """
+    Per-day JD, Mars torque proxy and planet strengths for ``dates``.
+
+    ``global_power`` maps a Julian Day to the scorer's per-planet dict
+    (``GlobalShadbalaScorer.calculate_global_power`` or a memoized wrapper);
+    the returned dicts are only read.
+    """
+    n_days = len(dates)
+
+    # Julian Days for the whole range at once; the Unix epoch is JD 2440587.5
+    jd_arr = ((dates - pd.Timestamp('1970-01-01')) / pd.Timedelta(days=1)).to_numpy() + 2440587.5
+
+    # Preallocated columns filled by index; the DataFrame is built once.
+    mars_torque = np.empty(n_days)
+    strengths = {p: np.empty(n_days) for p in planets}
+
+    for i, jd in enumerate(jd_arr.tolist()):
+        scores = global_power(jd)
+
+        # Heliocentric positions for Physical Coupling test
+        # Using Mars as a proxy for localized torque for now
+        mars_helio = ee.get_heliocentric_position(jd, "Mars")
+
+        mars_torque[i] = mars_helio['x_vector'] # Placeholder for complex torque
+
+        # Add planetary strengths
+        for p in planets:
+            # Handle case-sensitivity fix from Phase 2
+            disp_name = p.name.capitalize()
+            strengths[p][i] = scores.get(disp_name, scores.get(p.name, 0.0))
+
+    return pd.DataFrame({
+        'jd': jd_arr,
+        'mars_torque': mars_torque,
+        **{f'strength_{p.name}': strengths[p] for p in planets},
+    })
+
+
+def _planetary_columns_chunk(dates, planets):
+    """Planetary columns for one slice of days (worker process)."""
+    ee = EphemerisEngine()
+    gs = GlobalShadbalaScorer(ephemeris=ee)
+    return _planetary_columns(dates, planets, ee, gs.calculate_global_power)
+
+
 class EarthquakeRigorAnalysis:
-    def __init__(self, eq_data_path):
+    # Below this many days per worker, process start-up outweighs the gain.
+    MIN_DAYS_PER_WORKER = 500
+
+    def __init__(self, eq_data_path, cache_dir=None):
         self.eq_data_path = eq_data_path
+        self.cache_dir = cache_dir or os.path.join(
+            ROOT_DIR, "use_cases/earthquake/data/rigor_cache"
+        )
         self.ee = EphemerisEngine()
         self.gs = GlobalShadbalaScorer(ephemeris=self.ee)
+        # Scores are a pure function of the Julian Day; memoize them so
+        # overlapping ranges in one session are only scored once.
+        self._global_power = functools.lru_cache(maxsize=8192)(
+            self.gs.calculate_global_power
+        )
         self.df_eq = self._load_data()
         self.planets_to_test = [Planet.MARS, Planet.SATURN, Planet.JUPITER, Planet.RAHU]
         
@@ -43,80 +117,161 @@ class EarthquakeRigorAnalysis:
                 df['dt'] = pd.to_datetime(df['time'], unit='ms')
         else:
             df['dt'] = pd.to_datetime(df['datetime'])
+
+        # Calendar day of each event (wall clock of its own timezone), for
+        # binning by day without per-row date objects.
+        dt = df['dt'].dt.tz_localize(None) if df['dt'].dt.tz is not None else df['dt']
+        df['day'] = dt.to_numpy().astype('datetime64[D]')
             
         return df
 
     def generate_rigor_matrix(self, start_date, end_date):
         print(f"Generating rigor matrix from {start_date} to {end_date}...")
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        rows = []
-        
-        for d in dates:
-            jd = self.ee.datetime_to_julian_day(d)
-            scores = self.gs.calculate_global_power(jd)
-            
-            # Heliocentric positions for Physical Coupling test
-            # Using Mars as a proxy for localized torque for now
-            mars_helio = self.ee.get_heliocentric_position(jd, "Mars")
-            
-            row = {
-                'date': d.date(),
-                'jd': jd,
-                'mars_torque': mars_helio['x_vector'], # Placeholder for complex torque
-            }
-            
-            # Add planetary strengths
-            for p in self.planets_to_test:
-                # Handle case-sensitivity fix from Phase 2
-                disp_name = p.name.capitalize()
-                row[f'strength_{p.name}'] = scores.get(disp_name, scores.get(p.name, 0.0))
-            
-            # Add earthquake counts for this day
-            evs = self.df_eq[(self.df_eq['dt'].dt.date == d.date()) & (self.df_eq['magnitude'] >= 6.0)]
-            row['eq_count_m6'] = len(evs)
-            row['max_mag'] = evs['magnitude'].max() if not evs.empty else 0
-            
-            rows.append(row)
-            
-        return pd.DataFrame(rows)
+        df = self._planetary_columns(dates)
+        df.insert(0, 'date', dates.date)
+
+        # Add earthquake counts per day: bin the M6+ events by calendar day
+        # in one pass instead of filtering the catalogue once per day.
+        eq_hi = self.df_eq[self.df_eq['magnitude'] >= 6.0]
+        by_day = eq_hi.groupby('day')['magnitude'].agg(['count', 'max'])
+
+        df['eq_count_m6'] = by_day['count'].reindex(dates, fill_value=0).to_numpy(dtype=np.int64)
+        df['max_mag'] = by_day['max'].reindex(dates, fill_value=0).to_numpy(dtype=np.float64)
+        return df
+
+    def _planetary_columns(self, dates):
+        """
+        Daily JD, Mars torque proxy and planet strengths for ``dates``.
+
+        These do not depend on the earthquake catalogue, so they are cached
+        under ``cache_dir`` (Parquet when pyarrow is installed, pickle
+        otherwise), keyed by the date range, the planets and the source of
+        the ephemeris/scoring code, so repeated runs skip the ephemeris calls.
+        """
+        digest = hashlib.sha256(dates.asi8.tobytes())
+        digest.update(",".join(p.name for p in self.planets_to_test).encode())
+        for obj in (_planetary_columns, GlobalShadbalaScorer,
+                    DignityScorer, EphemerisEngine):
+            digest.update(inspect.getsource(obj).encode())
+        suffix = '.parquet' if PYARROW_AVAILABLE else '.pkl'
+        cache_path = os.path.join(self.cache_dir, f"rigor_{digest.hexdigest()}{suffix}")
+
+        if os.path.exists(cache_path):
+            print(f"Using cached planetary strengths from {cache_path}")
+            if PYARROW_AVAILABLE:
+                return pd.read_parquet(cache_path)
+            return pd.read_pickle(cache_path)
+
+        df = self._compute_planetary_columns(dates)
+
+        if not df.empty:
+            # Write to a temporary file first so an interrupted run never
+            # leaves a truncated cache entry behind.
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            if PYARROW_AVAILABLE:
+                df.to_parquet(tmp_path, compression='zstd', index=False)
+            else:
+                df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+
+        return df
+
+    def _compute_planetary_columns(self, dates):
+        """Compute the per-day ephemeris and strength columns (uncached)."""
+        # Days are independent, so long ranges are split across processes;
+        # each worker builds its own ephemeris/scorer instances.
+        workers = min(os.cpu_count() or 1, len(dates) // self.MIN_DAYS_PER_WORKER)
+        if workers > 1:
+            chunks = [dates[idx] for idx in np.array_split(np.arange(len(dates)), workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = pool.map(_planetary_columns_chunk, chunks,
+                                 [self.planets_to_test] * workers)
+                return pd.concat(list(parts), ignore_index=True)
+
+        return _planetary_columns(dates, self.planets_to_test, self.ee, self._global_power)
 
     def calculate_molchan_diagram(self, df, predictor_col, target_col='eq_count_m6'):
         """
         Implementation of Molchan Diagram (1990).
         Tau (τ): Fraction of total time covered by alarms.
         Nu (ν): Fraction of missed events.
+        Rows are ordered by descending threshold, so tau is ascending.
         """
-        thresholds = np.sort(df[predictor_col].unique())[::-1]
-        n_total_events = df[target_col].sum()
+        values = df[predictor_col].to_numpy()
+        events = df[target_col].to_numpy()
+        n_total_events = events.sum()
         n_total_days = len(df)
-        
-        molchan_data = []
-        
-        for t in thresholds:
-            alarms = df[df[predictor_col] >= t]
-            n_alarms = len(alarms)
-            n_hits = alarms[target_col].sum()
-            n_misses = n_total_events - n_hits
-            
-            tau = n_alarms / n_total_days
-            nu = n_misses / n_total_events if n_total_events > 0 else 1.0
-            
-            molchan_data.append({'threshold': t, 'tau': tau, 'nu': nu})
-            
-        return pd.DataFrame(molchan_data)
+
+        # One descending sort and a running sum of events replace a
+        # filter-and-sum per threshold: the alarm set for threshold t is the
+        # sorted prefix ending at the last occurrence of t.
+        order = np.argsort(-values, kind='stable')
+        sorted_values = values[order]
+        hits_cum = np.cumsum(events[order])
+        last = np.flatnonzero(np.append(sorted_values[1:] != sorted_values[:-1], True))
+
+        n_alarms = last + 1
+        n_misses = n_total_events - hits_cum[last]
+
+        tau = n_alarms / n_total_days
+        if n_total_events > 0:
+            nu = n_misses / n_total_events
+        else:
+            nu = np.ones(len(last))
+
+        return pd.DataFrame({'threshold': sorted_values[last], 'tau': tau, 'nu': nu})
 
     def analyze_lags(self, df, predictor_col, target_col='eq_count_m6', max_lag=30):
         lags = range(-max_lag, max_lag + 1)
-        corrs = []
-        for lag in lags:
-            shifted_predictor = df[predictor_col].shift(lag)
-            mask = ~shifted_predictor.isna()
-            if mask.any():
-                corr, _ = pearsonr(shifted_predictor[mask], df[target_col][mask])
-                corrs.append(corr)
-            else:
-                corrs.append(0)
-        return lags, corrs
+        x = df[predictor_col].to_numpy(dtype=np.float64)
+        y = df[target_col].to_numpy(dtype=np.float64)
+
+        # Lag L pairs the predictor shifted by L (x[i - L]) with y[i] over
+        # their overlap. Every per-lag sum Pearson r needs (pair count, sums,
+        # sums of squares and cross products over that overlap) is a
+        # cross-correlation, so all lags come from a few FFT correlations.
+        # Inputs are centred first (r is shift-invariant) to keep the sums
+        # well conditioned; NaN predictors are masked out as before.
+        valid = ~np.isnan(x)
+        y_nan = np.isnan(y)
+        x_mean = x[valid].mean() if valid.any() else 0.0
+        y_mean = y[~y_nan].mean() if not y_nan.all() else 0.0
+
+        # Zero padding keeps lags longer than the overlap inside the output.
+        pad = np.zeros(max_lag)
+        m = np.concatenate([valid.astype(np.float64), pad])
+        x0 = np.concatenate([np.where(valid, x - x_mean, 0.0), pad])
+        y0 = np.concatenate([np.where(y_nan, 0.0, y - y_mean), pad])
+        ones = np.concatenate([np.ones(len(y)), pad])
+
+        mid = len(m) - 1
+
+        def xcorr(a, b):
+            full = correlate(a, b, mode='full', method='fft')
+            return full[mid - max_lag:mid + max_lag + 1]
+
+        n = np.rint(xcorr(ones, m))
+        sx, sxx = xcorr(ones, x0), xcorr(ones, x0 * x0)
+        sy, syy = xcorr(y0, m), xcorr(y0 * y0, m)
+        sxy = xcorr(y0, x0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sxy - sx * sy / n
+            var_x = sxx - sx * sx / n
+            var_y = syy - sy * sy / n
+            # FFT round-off scales with the whole series' energy; below that a
+            # constant overlap is undefined (NaN), as pearsonr reports it.
+            defined = (var_x > 1e-10 * (x0 @ x0)) & (var_y > 1e-10 * (y0 @ y0))
+            corrs = np.where(defined, cov / np.sqrt(var_x * var_y), np.nan)
+
+        # A NaN target inside the overlap makes that lag's r undefined.
+        if y_nan.any():
+            corrs[np.rint(xcorr(np.concatenate([y_nan, pad]), m)) > 0] = np.nan
+
+        corrs = np.where(n > 0, np.clip(corrs, -1.0, 1.0), 0.0)
+        return lags, corrs.tolist()
 
     def run(self):
         # 1. Generate Data (Last 5 years for enough stats)
@@ -165,10 +320,9 @@ class EarthquakeRigorAnalysis:
         best_lag = lags[best_lag_idx]
         best_corr = corrs[best_lag_idx]
         
-        # Area under Molchan curve (AUC) - ensure positive by sorting tau
-        tau_sort = np.sort(molchan_mars['tau'])
-        nu_sort = np.interp(tau_sort, molchan_mars['tau'][::-1], molchan_mars['nu'][::-1])
-        auc = np.trapz(nu_sort, tau_sort)
+        # Area under Molchan curve (AUC); rows run from the highest threshold
+        # down, so tau is already ascending.
+        auc = trapezoid(molchan_mars['nu'].to_numpy(), molchan_mars['tau'].to_numpy())
         
         report = f"""# Scientific Rigor Report: Earthquake Tracking (Track 2)
 **Metric**: Seismological Validation (Molchan Diagram & Time Lags)
@@ -26,17 +26,12 @@ from vedic_astrology_core.config.constants import Planet
 def generate_curves(year: int = 2023):
     """
     Generate 2-hour resolution curves for a full year.
+
+    The series is computed and appended to the CSV one month at a time, so
+    peak memory stays at a single month regardless of the span.
     """
     print(f"Generating 2-hour strength curves for {year}...")
 
-    start_date = f"{year}-01-01"
-    end_date = f"{year}-12-31"
-
-    # We use step_hours=2.0 as requested
-    df = compute_astrology_strength_series(
-        start_date=start_date, end_date=end_date, step_hours=2.0
-    )
-
     # Ensure asset directory exists
     output_dir = os.path.abspath(
         os.path.join(os.path.dirname(__file__), "../../../assets/data")
@@ -44,14 +39,43 @@ def generate_curves(year: int = 2023):
     os.makedirs(output_dir, exist_ok=True)
 
     output_path = os.path.join(output_dir, f"planetary_strength_curves_{year}_2h.csv")
-    df.to_csv(output_path, index=False)
 
-    print(f"✅ Generated {len(df)} data points (2-hr intervals).")
+    n_rows = 0
+    stats = []
+    for month in pd.period_range(f"{year}-01", f"{year}-12", freq="M"):
+        # We use step_hours=2.0 as requested; 24 is a multiple of 2, so the
+        # monthly chunks line up with a single continuous 2-hour grid.
+        df = compute_astrology_strength_series(
+            start_date=month.start_time.date(),
+            end_date=month.end_time.date(),
+            step_hours=2.0,
+        )
+        df.to_csv(
+            output_path,
+            mode="w" if n_rows == 0 else "a",
+            header=n_rows == 0,
+            index=False,
+            float_format="%.7g",
+        )
+        n_rows += len(df)
+        stats.append(df.drop(columns="date").agg(["count", "sum", "min", "max"]))
+
+    print(f"✅ Generated {n_rows} data points (2-hr intervals).")
     print(f"✅ Saved to: {output_path}")
 
-    # Basic Stats
+    # Basic Stats, combined from the per-month aggregates
+    stats = pd.concat(stats)
+    count = stats.loc["count"].sum()
+    summary = pd.DataFrame(
+        {
+            "count": count,
+            "mean": stats.loc["sum"].sum() / count,
+            "min": stats.loc["min"].min(),
+            "max": stats.loc["max"].max(),
+        }
+    ).T
     print("\nVariation Statistics:")
-    print(df.describe())
+    print(summary)
 
 
 if __name__ == "__main__":
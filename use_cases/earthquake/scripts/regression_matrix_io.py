@@ -0,0 +1,74 @@
+"""
+Regression Matrix Loader.
+
+Shared reader for the daily regression matrix CSV written by
+build_regression_matrix.py and consumed by the SEA and GLM scripts.
+
+The parsed frame is snapshotted under ``data/matrix_cache`` (Parquet when
+pyarrow is installed, pickle otherwise), keyed by the CSV path, size and
+modification time, so later runs skip the text parse entirely.
+"""
+
+import hashlib
+import inspect
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (CSV engine and Parquet snapshots for pandas)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "matrix_cache"
+
+
+def load_regression_matrix(matrix_path: str, cache_dir=None) -> pd.DataFrame:
+    """
+    Load the daily regression matrix with ``date`` parsed to datetime.
+
+    Args:
+        matrix_path: Path to the regression matrix CSV
+        cache_dir: Snapshot directory (defaults to ``data/matrix_cache``)
+
+    Returns:
+        DataFrame of the matrix. A snapshot is reused only while the CSV's
+        size and mtime (and this loader's code) are unchanged; otherwise the
+        CSV is parsed and the snapshot for that path replaced.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    abs_path = os.path.abspath(matrix_path)
+    stat = os.stat(abs_path)
+
+    path_key = hashlib.sha256(abs_path.encode()).hexdigest()[:16]
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    digest.update(inspect.getsource(load_regression_matrix).encode())
+    suffix = ".parquet" if PYARROW_AVAILABLE else ".pkl"
+    cache_path = cache_dir / f"{path_key}_{digest.hexdigest()[:16]}{suffix}"
+
+    if cache_path.exists():
+        if PYARROW_AVAILABLE:
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+
+    # The Arrow reader tokenizes in parallel; columns stay NumPy-backed so
+    # callers see the same dtypes as with the default engine.
+    df = pd.read_csv(abs_path, engine="pyarrow" if PYARROW_AVAILABLE else "c")
+    df["date"] = pd.to_datetime(df["date"])
+
+    # Drop snapshots of older versions of this CSV, then write atomically so
+    # an interrupted run never leaves a truncated snapshot behind.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{path_key}_*{suffix}"):
+        stale.unlink(missing_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    if PYARROW_AVAILABLE:
+        df.to_parquet(tmp_path, compression="zstd", index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    return df
@@ -5,8 +5,8 @@ Statistical validation tool for the Research Pipeline.
 "Stacks" the timelines of the largest earthquakes to detect common precursors.
 """
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import sys
 import os
 from pathlib import Path
@@ -14,9 +14,13 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent.parent / "src"))
 
+from regression_matrix_io import load_regression_matrix
+
 
 def perform_sea_analysis(
-    matrix_path: str = "regression_matrix.csv", output_dir: str = "sea_plots"
+    matrix_path: str = "regression_matrix.csv",
+    output_dir: str = "sea_plots",
+    cache_dir=None,
 ):
     """
     Perform Superposed Epoch Analysis.
@@ -24,6 +28,12 @@ def perform_sea_analysis(
     Args:
         matrix_path: Path to daily regression matrix CSV
         output_dir: Directory to save plots
+        cache_dir: Matrix snapshot directory passed to
+            ``load_regression_matrix`` (defaults to ``data/matrix_cache``)
+
+    Returns:
+        DataFrame of mean UDN / Mars score and event count per day offset,
+        or None when there is no matrix or no qualifying event.
     """
     if not os.path.exists(matrix_path):
         print(
@@ -31,8 +41,7 @@ def perform_sea_analysis(
         )
         return
 
-    df = pd.read_csv(matrix_path)
-    df["date"] = pd.to_datetime(df["date"])
+    df = load_regression_matrix(matrix_path, cache_dir=cache_dir)
 
     # 1. Identify Key Events (Epochs)
     # Filter for significant earthquakes in the matrix
@@ -52,78 +61,78 @@ def perform_sea_analysis(
 
     # 2. Define Window
     window_days = 10
-    window_range = range(-window_days, window_days + 1)
 
     # 3. Stack Data
-    # We want valid indices (ensure window doesn't go out of bounds)
-    stacked_udn = {d: [] for d in window_range}
-    stacked_mars = {d: [] for d in window_range}
-
-    for _, event in epochs.iterrows():
-        event_date = event["date"]
-
-        # Get slice
-        for delta in window_range:
-            target_date = event_date + pd.Timedelta(days=delta)
-
-            # Find row in full df
-            row = df[df["date"] == target_date]
+    # Every (event, delta) target date as one broadcast grid, looked up in a
+    # single reindex on the date index instead of scanning the matrix per
+    # target. The first row wins for duplicate dates; targets outside the
+    # matrix stay missing.
+    by_date = df.drop_duplicates("date").set_index("date").sort_index()
+    deltas = np.arange(-window_days, window_days + 1)
+    target_dates = pd.DatetimeIndex(
+        (
+            epochs["date"].to_numpy()[:, None]
+            + deltas[None, :] * np.timedelta64(1, "D")
+        ).ravel()
+    )
+    lookup = by_date[["udn", "mars_score"]].reindex(target_dates)
 
-            if not row.empty:
-                val = row.iloc[0]
-                stacked_udn[delta].append(val["udn"])
-                stacked_mars[delta].append(val["mars_score"])
+    # (delta, event) grids; missing targets are NaN.
+    shape = (len(epochs), len(deltas))
+    found = target_dates.isin(by_date.index).reshape(shape).T
+    udn = lookup["udn"].to_numpy(dtype=np.float64).reshape(shape).T
+    mars = lookup["mars_score"].to_numpy(dtype=np.float64).reshape(shape).T
 
     # 4. Aggregate
-    sea_results = []
-    for delta in window_range:
-        udn_vals = stacked_udn[delta]
-        mars_vals = stacked_mars[delta]
-
-        if udn_vals:
-            sea_results.append(
-                {
-                    "delta": delta,
-                    "mean_udn": sum(udn_vals) / len(udn_vals),
-                    "mean_mars": sum(mars_vals) / len(mars_vals),
-                    "count": len(udn_vals),
-                }
-            )
-
-    sea_df = pd.DataFrame(sea_results)
+    # Column means per delta over the events that have data; deltas with no
+    # data at all are left out.
+    count = found.sum(axis=1)
+    keep = count > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_udn = np.nansum(udn, axis=1) / (~np.isnan(udn)).sum(axis=1)
+        mean_mars = np.nansum(mars, axis=1) / (~np.isnan(mars)).sum(axis=1)
+
+    sea_df = pd.DataFrame(
+        {
+            "delta": deltas[keep],
+            "mean_udn": mean_udn[keep],
+            "mean_mars": mean_mars[keep],
+            "count": count[keep],
+        }
+    )
 
     # 5. Visualize
+    # Imported here so runs that return early never load matplotlib.
+    import matplotlib.pyplot as plt
+
     os.makedirs(output_dir, exist_ok=True)
 
-    # Plot UDN
-    plt.figure(figsize=(10, 6))
-    plt.plot(sea_df["delta"], sea_df["mean_udn"], marker="o", label="Mean UDN")
-    plt.axvline(0, color="r", linestyle="--", label="Earthquake Day")
-    plt.title(f"Superposed Epoch Analysis: UDN (N={len(epochs)})")
-    plt.xlabel("Days from Event")
-    plt.ylabel("Mean Universal Day Number")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(f"{output_dir}/sea_udn.png")
-    print(f"✅ Saved SEA plot to {output_dir}/sea_udn.png")
-
-    # Plot Mars
-    plt.figure(figsize=(10, 6))
-    plt.plot(
+    # Both panels share one figure and one render: UDN on top, Mars below,
+    # on a common "Days from Event" axis.
+    fig, (ax_udn, ax_mars) = plt.subplots(2, 1, figsize=(10, 10), sharex=True)
+    ax_udn.plot(sea_df["delta"], sea_df["mean_udn"], marker="o", label="Mean UDN")
+    ax_udn.set_title(f"Superposed Epoch Analysis: UDN (N={len(epochs)})")
+    ax_udn.set_ylabel("Mean Universal Day Number")
+    ax_mars.plot(
         sea_df["delta"],
         sea_df["mean_mars"],
         marker="s",
         color="orange",
         label="Mean Mars Score",
     )
-    plt.axvline(0, color="r", linestyle="--", label="Earthquake Day")
-    plt.title(f"Superposed Epoch Analysis: Mars Strength (N={len(epochs)})")
-    plt.xlabel("Days from Event")
-    plt.ylabel("Global Shadbala Score")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(f"{output_dir}/sea_mars.png")
-    print(f"✅ Saved SEA plot to {output_dir}/sea_mars.png")
+    ax_mars.set_title(f"Superposed Epoch Analysis: Mars Strength (N={len(epochs)})")
+    ax_mars.set_ylabel("Global Shadbala Score")
+    ax_mars.set_xlabel("Days from Event")
+    for ax in (ax_udn, ax_mars):
+        ax.axvline(0, color="r", linestyle="--", label="Earthquake Day")
+        ax.legend()
+        ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(f"{output_dir}/sea_combined.png")
+    print(f"✅ Saved SEA plot to {output_dir}/sea_combined.png")
+    plt.close(fig)
+
+    return sea_df
 
 
 if __name__ == "__main__":
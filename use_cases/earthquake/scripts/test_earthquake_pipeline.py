@@ -13,6 +13,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+import pandas as pd
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -26,6 +28,8 @@ class EarthquakeAnalysisTester:
         """Initialize tester."""
         self.verbose = verbose
         self.results = {"tests_passed": 0, "tests_failed": 0, "details": []}
+        # Sample-data fetch/processing outcomes shared by tests 2-4.
+        self._sample = {}
 
     def _log(self, message: str, level: str = "INFO") -> None:
         """Print log message."""
@@ -39,6 +43,38 @@ class EarthquakeAnalysisTester:
             }.get(level, "")
             print(f"{icon} {message}")
 
+    def _memo(self, name, compute):
+        """Run ``compute`` once per tester; later calls reuse its result or error."""
+        if name not in self._sample:
+            try:
+                self._sample[name] = (True, compute())
+            except Exception as e:
+                self._sample[name] = (False, e)
+        ok, value = self._sample[name]
+        if not ok:
+            raise value
+        return value
+
+    def _sample_data(self):
+        """Fetcher and raw 2020 sample catalog, fetched once."""
+
+        def fetch():
+            fetcher = EarthquakeDataFetcher(use_sample_data=True, verbose=False)
+            return fetcher, fetcher.fetch_earthquakes(
+                start_date="2020-01-01", end_date="2020-12-31", use_usgs_api=False
+            )
+
+        return self._memo("raw", fetch)
+
+    def _processed_sample(self):
+        """Processed 2020 sample catalog, processed once."""
+
+        def process():
+            fetcher, raw_data = self._sample_data()
+            return fetcher.process_for_analysis(raw_data)
+
+        return self._memo("processed", process)
+
     def test_data_fetcher_init(self) -> bool:
         """Test 1: Initialize data fetcher."""
         self._log("Test 1: Initialize earthquake data fetcher", "TEST")
@@ -56,10 +92,7 @@ class EarthquakeAnalysisTester:
         """Test 2: Load sample earthquake data."""
         self._log("Test 2: Load sample earthquake data", "TEST")
         try:
-            fetcher = EarthquakeDataFetcher(use_sample_data=True, verbose=False)
-            data = fetcher.fetch_earthquakes(
-                start_date="2020-01-01", end_date="2020-12-31", use_usgs_api=False
-            )
+            _, data = self._sample_data()
 
             features = data.get("features", [])
             if len(features) > 0:
@@ -80,12 +113,7 @@ class EarthquakeAnalysisTester:
         """Test 3: Process earthquake data."""
         self._log("Test 3: Process earthquake data", "TEST")
         try:
-            fetcher = EarthquakeDataFetcher(use_sample_data=True, verbose=False)
-            raw_data = fetcher.fetch_earthquakes(
-                start_date="2020-01-01", end_date="2020-12-31", use_usgs_api=False
-            )
-
-            processed = fetcher.process_for_analysis(raw_data)
+            processed = self._processed_sample()
 
             if len(processed) > 0:
                 # Validate structure
@@ -127,24 +155,23 @@ class EarthquakeAnalysisTester:
         """Test 4: Validate processed data quality."""
         self._log("Test 4: Validate processed data quality", "TEST")
         try:
-            fetcher = EarthquakeDataFetcher(use_sample_data=True, verbose=False)
-            raw_data = fetcher.fetch_earthquakes(
-                start_date="2020-01-01", end_date="2020-12-31", use_usgs_api=False
-            )
+            processed = self._processed_sample()
 
-            processed = fetcher.process_for_analysis(raw_data)
-
-            # Validation checks
+            # Validation checks, evaluated column-wise over the whole catalog
+            eqs = pd.DataFrame(
+                processed,
+                columns=["date", "magnitude", "place", "latitude", "longitude"],
+            )
             checks = {
-                "magnitude_valid": all(0 <= eq["magnitude"] <= 10 for eq in processed),
-                "date_format": all(
-                    len(eq["date"]) == 10 for eq in processed
-                ),  # YYYY-MM-DD
-                "coordinates_valid": all(
-                    -180 <= eq["longitude"] <= 180 and -90 <= eq["latitude"] <= 90
-                    for eq in processed
+                "magnitude_valid": bool(eqs["magnitude"].between(0, 10).all()),
+                "date_format": bool((eqs["date"].str.len() == 10).all()),  # YYYY-MM-DD
+                "coordinates_valid": bool(
+                    (
+                        eqs["longitude"].between(-180, 180)
+                        & eqs["latitude"].between(-90, 90)
+                    ).all()
                 ),
-                "location_present": all(len(eq["place"]) > 0 for eq in processed),
+                "location_present": bool((eqs["place"].str.len() > 0).all()),
             }
 
             all_valid = all(checks.values())
@@ -16,36 +16,104 @@ It trains two types of Generalized Linear Models (GLM):
 Output: Summary of regression coefficients and AIC/BIC comparison.
 """
 
+import hashlib
+import inspect
 import pandas as pd
-import matplotlib
-matplotlib.use('Agg')
 import numpy as np
 import statsmodels.api as sm
-import statsmodels.formula.api as smf
 import sys
 import os
 import json
-import json
 from pathlib import Path
-import matplotlib.pyplot as plt
+
+from regression_matrix_io import load_regression_matrix
 
 
+def _design_matrices(df, target, predictors, categorical=None):
+    """
+    Build the endog/exog pair for ``target ~ predictors [+ C(categorical)]``.
 
-def train_models(matrix_path: str = "regression_matrix.csv", target_mag: float = 5.0):
+    Matches the Patsy treatment coding the formulas used to go through: an
+    Intercept column, one ``C(name)[T.level]`` dummy per level after the
+    first (sorted), then the numeric predictors in order. Rows with a missing
+    value in any used column are dropped. The exog is a C-contiguous float64
+    array wrapped in a DataFrame so fitted parameters keep their names.
+    """
+    used = [target, *predictors] + ([categorical] if categorical else [])
+    data = df.loc[df[used].notna().all(axis=1)]
+
+    names = ["Intercept"]
+    blocks = [np.ones((len(data), 1))]
+    if categorical:
+        codes = data[categorical].to_numpy()
+        levels = np.unique(codes)[1:]
+        names += [f"C({categorical})[T.{level}]" for level in levels.tolist()]
+        blocks.append(codes[:, None] == levels[None, :])
+    names += list(predictors)
+    blocks.append(data[list(predictors)].to_numpy(dtype=np.float64))
+
+    exog = np.hstack(blocks).astype(np.float64, order="C", copy=False)
+    y = data[[target]].astype(np.float64)
+    return y, pd.DataFrame(exog, index=data.index, columns=names)
+
+
+def train_models(
+    matrix_path: str = "regression_matrix.csv",
+    target_mag: float = 5.0,
+    artifacts: bool = True,
+    cache_dir=None,
+):
     """
     Train GLMs on the regression matrix.
 
     Args:
         matrix_path: Path to daily CSV.
         target_mag: Minimum magnitude threshold used for counts (meta-data only here).
+        artifacts: Also write the paper artifacts (coefficient table and
+            predicted-vs-actual figure). Pass ``--no-artifacts`` on the
+            command line to only fit and save model_results.json.
+        cache_dir: Matrix snapshot directory passed to
+            ``load_regression_matrix`` (defaults to ``data/matrix_cache``).
+
+    Returns:
+        The results dict written to model_results.json, or None on failure.
+        When model_results.json already holds results for the same matrix
+        bytes and model code (formulas included), and the paper artifacts
+        exist (when requested), those results are returned without refitting.
     """
     if not os.path.exists(matrix_path):
         print(f"Matrix file {matrix_path} not found.")
         return
 
-    df = pd.read_csv(matrix_path)
-    # Ensure date is datetime
-    df["date"] = pd.to_datetime(df["date"])
+    with open(matrix_path, "rb") as f:
+        raw = f.read()
+    key = hashlib.sha256(raw)
+    for func in (train_models, _design_matrices, load_regression_matrix):
+        key.update(inspect.getsource(func).encode())
+    # Results from a --no-artifacts run say nothing about the files on disk.
+    key.update(b"artifacts" if artifacts else b"")
+    key = key.hexdigest()
+
+    # The key lives in a sidecar file so model_results.json keeps its schema.
+    outputs = ["model_results.json", "model_results.key"]
+    if artifacts:
+        outputs += ["regression_coefficients.csv", "predicted_vs_actual.png"]
+    if all(os.path.exists(o) for o in outputs):
+        try:
+            with open("model_results.key") as f:
+                cached_key = f.read().strip()
+            with open("model_results.json") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached_key = None
+        if cached_key == key:
+            print(
+                f"Model results for {matrix_path} are up to date "
+                "(model_results.json); skipping refit."
+            )
+            return cached
+
+    df = load_regression_matrix(matrix_path, cache_dir=cache_dir)
 
     # Feature Engineering for Baseline
     # Add Day of Year (DOY) for seasonality
@@ -53,19 +121,54 @@ def train_models(matrix_path: str = "regression_matrix.csv", target_mag: float =
     df["year_index"] = df["date"].dt.year - df["date"].dt.year.min()
 
     # Harmonic Seasonality (Annual Cycle)
-    df["sin_doy"] = np.sin(2 * np.pi * df["doy"] / 365.25)
-    df["cos_doy"] = np.cos(2 * np.pi * df["doy"] / 365.25)
+    # DOY takes at most 366 values, so evaluate the harmonics once per day of
+    # the year and index them instead of once per row.
+    doy_angle = 2 * np.pi * np.arange(1, 367) / 365.25
+    doy_idx = df["doy"].to_numpy() - 1
+    df["sin_doy"] = np.sin(doy_angle)[doy_idx]
+    df["cos_doy"] = np.cos(doy_angle)[doy_idx]
 
     print(f"Training models on {len(df)} days. Target: eq_count_m5")
 
-    # --- 1. Baseline Model (Poisson) ---
-    # Hypothesis: Random process + Seasonal Weather/Tidal stress + Catalog improvement trend
-    baseline_formula = "eq_count_m5 ~ year_index + sin_doy + cos_doy"
+    # Model terms
+    # Baseline hypothesis: Random process + Seasonal Weather/Tidal stress +
+    # Catalog improvement trend.
+    #   eq_count_m5 ~ year_index + sin_doy + cos_doy
+    baseline_terms = ["year_index", "sin_doy", "cos_doy"]
 
+    # Research predictors:
+    # - C(udn): Categorical Universal Day Number (is Day 8 differnet from Day 1?)
+    # - Mars Score: Global Strength of Mars (Energy/Violence archetype)
+    # - Saturn Score: Global Strength of Saturn (Structure/Tectonic archetype)
+    # - Retrograde status is baked into the scores.
+    #   eq_count_m5 ~ year_index + sin_doy + cos_doy +
+    #                 C(udn) + mars_score + saturn_score + sun_score + moon_score
+    research_terms = baseline_terms + [
+        "mars_score",
+        "saturn_score",
+        "sun_score",
+        "moon_score",
+    ]
+
+    # Design matrices are built once, directly as NumPy arrays: the baseline
+    # columns are a subset of the research design (including its intercept),
+    # so both models share the same dummy encoding of C(udn).
     try:
-        baseline_model = smf.glm(
-            formula=baseline_formula, data=df, family=sm.families.Poisson()
-        ).fit()
+        y, X_full = _design_matrices(
+            df, "eq_count_m5", research_terms, categorical="udn"
+        )
+        if len(X_full) == len(df):
+            y_base, X_base = y, X_full[["Intercept", *baseline_terms]]
+        else:
+            # Rows with missing research predictors only drop from that model.
+            y_base, X_base = _design_matrices(df, "eq_count_m5", baseline_terms)
+    except Exception as e:
+        print(f"Design matrix construction failed: {e}")
+        return
+
+    # --- 1. Baseline Model (Poisson) ---
+    try:
+        baseline_model = sm.GLM(y_base, X_base, family=sm.families.Poisson()).fit()
 
         print("\n" + "=" * 40)
         print("BASELINE MODEL (Poisson)")
@@ -81,24 +184,11 @@ def train_models(matrix_path: str = "regression_matrix.csv", target_mag: float =
     # We use Negative Binomial to handle overdispersion (Variance > Mean),
     # which is typical for earthquake clusters.
 
-    # Predictors:
-    # - C(udn): Categorical Universal Day Number (is Day 8 differnet from Day 1?)
-    # - Mars Score: Global Strength of Mars (Energy/Violence archetype)
-    # - Saturn Score: Global Strength of Saturn (Structure/Tectonic archetype)
-    # - Retrograde status is baked into the scores.
-
-    research_formula = (
-        "eq_count_m5 ~ year_index + sin_doy + cos_doy + "
-        "C(udn) + mars_score + saturn_score + sun_score + moon_score"
-    )
-
     try:
         # Note: statsmodels NegativeBinomial family defaults to alpha=1 (geometric).
         # ideally we estimate alpha, but fixed alpha is often sufficient for comparison.
-        research_model = smf.glm(
-            formula=research_formula,
-            data=df,
-            family=sm.families.NegativeBinomial(alpha=1.0),
+        research_model = sm.GLM(
+            y, X_full, family=sm.families.NegativeBinomial(alpha=1.0)
         ).fit()
 
         print("\n" + "=" * 40)
@@ -150,31 +240,50 @@ def train_models(matrix_path: str = "regression_matrix.csv", target_mag: float =
 
     with open("model_results.json", "w") as f:
         json.dump(results, f, indent=2)
+    with open("model_results.key", "w") as f:
+        f.write(key)
     print("\nSaved full results to model_results.json")
 
+    if not artifacts:
+        return results
+
     # --- 4. Generate Paper Artifacts ---
 
     # Table 1: Coefficients
     # Extract coefficients, standard errors, z-scores, p-values, and confidence intervals
-    summary_df = pd.DataFrame({
-        "Variable": research_model.params.index,
-        "Coefficient": research_model.params.values,
-        "Std Error": research_model.bse.values,
-        "z": research_model.tvalues.values,
-        "P>|z|": research_model.pvalues.values,
-        "[0.025": research_model.conf_int()[0].values,
-        "0.975]": research_model.conf_int()[1].values
-    })
+    ci = research_model.conf_int()
+    ci.columns = ["[0.025", "0.975]"]
+    summary_df = (
+        pd.concat(
+            [
+                research_model.params.rename("Coefficient"),
+                research_model.bse.rename("Std Error"),
+                research_model.tvalues.rename("z"),
+                research_model.pvalues.rename("P>|z|"),
+                ci,
+            ],
+            axis=1,
+        )
+        .rename_axis("Variable")
+        .reset_index()
+    )
     summary_df.to_csv("regression_coefficients.csv", index=False)
     print("Saved regression_coefficients.csv")
 
     # Figure 1: Predicted vs Actual Rate
     # We aggregate to monthly to make the plot readable (daily is too noisy)
     df["predicted"] = research_model.fittedvalues
-    df["month"] = df["date"].dt.to_period("M")
-    
-    monthly = df.groupby("month")[["eq_count_m5", "predicted"]].sum()
-    monthly.index = monthly.index.to_timestamp()
+    monthly = (
+        df.set_index("date")[["eq_count_m5", "predicted"]]
+        .sort_index()
+        .resample("MS")
+        .sum()
+    )
+
+    # matplotlib is only needed here, so fit-only and cached runs skip it.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(12, 6))
     plt.plot(monthly.index, monthly["eq_count_m5"], label="Actual Earthquakes (M5+)", color="black", alpha=0.6)
@@ -188,7 +297,8 @@ def train_models(matrix_path: str = "regression_matrix.csv", target_mag: float =
     plt.savefig("predicted_vs_actual.png")
     print("Saved predicted_vs_actual.png")
 
+    return results
 
 
 if __name__ == "__main__":
-    train_models()
+    train_models(artifacts="--no-artifacts" not in sys.argv[1:])
@@ -0,0 +1,47 @@
+"""
+Athlete Sample Loader.
+
+Shared reader for the athlete sample written by fetch_athletes_sample.py.
+
+Besides athletes_sample.csv, names.csv and births.csv, the fetch script
+writes the same sample once as ``athletes_sample.parquet`` (when pyarrow is
+installed). The metric scripts read just the columns they need from it,
+falling back to their CSV when there is no Parquet copy or the CSV was
+written after it (e.g. a hand-edited names.csv).
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Parquet support for pandas)
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+PARQUET_PATH = DATA_DIR / "athletes_sample.parquet"
+
+
+def read_athletes(csv_path, columns) -> pd.DataFrame:
+    """
+    Load athlete data, preferring the Parquet copy of the sample.
+
+    Args:
+        csv_path: The CSV the caller would otherwise read
+        columns: Columns to project from the Parquet copy
+
+    Returns:
+        ``columns`` of the Parquet sample when it is at least as new as
+        ``csv_path``; otherwise the whole CSV.
+    """
+    csv_path = Path(csv_path)
+    if (
+        PYARROW_AVAILABLE
+        and PARQUET_PATH.exists()
+        and PARQUET_PATH.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+    ):
+        return pd.read_parquet(PARQUET_PATH, columns=list(columns))
+    return pd.read_csv(csv_path)
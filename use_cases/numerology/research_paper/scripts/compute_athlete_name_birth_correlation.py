@@ -4,9 +4,12 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from scipy.stats import chi2
+from scipy.stats.contingency import association
+
+from athletes_io import read_athletes
 
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
-athletes = pd.read_csv(DATA_DIR / "athletes_sample.csv")
+athletes = read_athletes(DATA_DIR / "athletes_sample.csv", ["name", "birth_date"])
 
 # Normalize columns
 athletes.columns = [c.strip().lower() for c in athletes.columns]
@@ -25,48 +28,72 @@ CHAL_MAP = {
     **{c: 7 for c in "OZ"}, **{c: 8 for c in "FP"},
 }
 MASTER = {11,22,33}
+MASTER_ARR = np.array(sorted(MASTER))
 VOWELS = set("AEIOUY")
 VEDIC_PLANETS = {1:"Sun",2:"Moon",3:"Jupiter",4:"Rahu",5:"Mercury",6:"Venus",7:"Ketu",8:"Saturn",9:"Mars"}
 
 
-def digital_root(n: int, preserve_master: bool = True) -> int:
-    if preserve_master and n in MASTER:
-        return n
-    return (n - 1) % 9 + 1 if n > 0 else 0
-
-
-def name_value(name: str, mapping: dict) -> int:
-    total = 0
-    for ch in name.upper():
-        if ch.isalpha():
-            total += mapping.get(ch, 0)
-    return total
-
-rows = []
-for _, row in athletes.iterrows():
-    name = str(row["name"])
-    b = str(row["birth_date"])[:10]
-
-    # Life Path
-    digits = [int(c) for c in b.replace("-", "") if c.isdigit()]
-    life_path = digital_root(sum(digits)) if digits else None
-
-    # Name Expression
-    pyth_expr = digital_root(name_value(name, PYTH_MAP))
-    chald_expr = digital_root(name_value(name, CHAL_MAP))
-
-    rows.append({
-        "name": name,
-        "birth_date": b,
-        "life_path": life_path,
-        "pyth_expression": pyth_expr,
-        "chald_expression": chald_expr,
-        "life_path_planet": VEDIC_PLANETS.get(life_path),
-        "pyth_planet": VEDIC_PLANETS.get(pyth_expr if pyth_expr <= 9 else None),
-        "chald_planet": VEDIC_PLANETS.get(chald_expr if chald_expr <= 9 else None),
-    })
-
-out = pd.DataFrame(rows)
+def digital_root_arr(n, preserve_master: bool = True) -> np.ndarray:
+    """Element-wise digital root of a non-negative integer array (0 stays 0)."""
+    n = np.asarray(n)
+    root = np.where(n > 0, (n - 1) % 9 + 1, 0)
+    if preserve_master:
+        root = np.where(np.isin(n, MASTER_ARR), n, root)
+    return root
+
+
+def letter_table(mapping: dict) -> bytes:
+    """256-byte lookup table: each mapped uppercase letter's byte -> its value, every other byte -> 0."""
+    table = bytearray(256)
+    for ch, value in mapping.items():
+        table[ord(ch)] = value
+    return bytes(table)
+
+
+PYTH_TABLE = letter_table(PYTH_MAP)
+CHAL_TABLE = letter_table(CHAL_MAP)
+
+
+def text_bytes(values: pd.Series) -> np.ndarray:
+    """(n_rows, max_len) zero-padded uint8 matrix of the Latin-1 encoded strings."""
+    # Characters outside Latin-1 become "?", which is neither a letter nor a digit.
+    encoded = np.array([v.encode("latin-1", "replace") for v in values], dtype=bytes)
+    return encoded.view(np.uint8).reshape(len(encoded), encoded.dtype.itemsize)
+
+
+def name_values(codes: np.ndarray, table: bytes) -> np.ndarray:
+    """Per-name letter sums: every byte of ``codes`` looked up in ``table``."""
+    return np.frombuffer(table, dtype=np.uint8)[codes].sum(axis=1, dtype=np.int64)
+
+
+names = athletes["name"].map(str)
+births = athletes["birth_date"].map(str).str[:10]
+
+# Life Path: digit sum of the birth date; no digits at all -> undefined
+date_codes = text_bytes(births)
+is_digit = (date_codes >= ord("0")) & (date_codes <= ord("9"))
+digit_sums = np.where(is_digit, date_codes - ord("0"), 0).sum(axis=1)
+life_path = pd.Series(digital_root_arr(digit_sums), index=athletes.index).where(
+    is_digit.any(axis=1)
+)
+
+# Name Expression (str.upper does full case mapping, so e.g. "ß" still
+# counts as "SS")
+name_codes = text_bytes(names.map(str.upper))
+pyth_expr = digital_root_arr(name_values(name_codes, PYTH_TABLE))
+chald_expr = digital_root_arr(name_values(name_codes, CHAL_TABLE))
+
+out = pd.DataFrame({
+    "name": names,
+    "birth_date": births,
+    "life_path": life_path,
+    "pyth_expression": pyth_expr,
+    "chald_expression": chald_expr,
+})
+# Master numbers (11/22/33) have no planet.
+out["life_path_planet"] = out["life_path"].map(VEDIC_PLANETS)
+out["pyth_planet"] = out["pyth_expression"].where(out["pyth_expression"] <= 9).map(VEDIC_PLANETS)
+out["chald_planet"] = out["chald_expression"].where(out["chald_expression"] <= 9).map(VEDIC_PLANETS)
 out.to_csv(DATA_DIR / "athlete_name_birth_metrics.csv", index=False)
 
 # Contingency tables
@@ -76,15 +103,10 @@ ct_chald = pd.crosstab(out["life_path"], out["chald_expression"])
 # Cramer's V
 
 def cramers_v(ct):
-    n = ct.values.sum()
-    if n == 0:
+    # A table with a single row or column (or no counts) has no association.
+    if ct.values.sum() == 0 or min(ct.shape) < 2:
         return 0
-    row_sums = ct.sum(axis=1).values.reshape(-1,1)
-    col_sums = ct.sum(axis=0).values.reshape(1,-1)
-    expected = row_sums @ col_sums / n
-    chi2 = ((ct.values - expected) ** 2 / expected).sum()
-    k = min(ct.shape) - 1
-    return np.sqrt(chi2 / (n * k)) if k > 0 else 0
+    return association(ct.values, method="cramer")
 
 summary = pd.DataFrame([
     {"metric":"cramers_v_pyth", "value": cramers_v(ct_pyth)},
@@ -1,17 +1,36 @@
 #!/usr/bin/env python3
 """Fetch athlete dataset and create sampled names/births files."""
+from datetime import datetime, timedelta
 from pathlib import Path
+from urllib.request import urlopen
+import os
 import pandas as pd
 
+from athletes_io import PARQUET_PATH, PYARROW_AVAILABLE
+
 URL = "https://raw.githubusercontent.com/stat408/Data/main/athletes%20new.csv"
 SAMPLE_N = 500
 SEED = 42
+# Re-download the source CSV once the local copy is older than this.
+CACHE_MAX_AGE = timedelta(days=7)
 
 out_dir = Path(__file__).resolve().parents[1] / "data"
 out_dir.mkdir(parents=True, exist_ok=True)
 
-# Load data
-athletes = pd.read_csv(URL)
+# Load data: the raw download is kept next to the outputs so re-runs parse
+# the same bytes without touching the network until the copy goes stale.
+raw_path = out_dir / "_athletes_raw.csv"
+if not raw_path.exists() or (
+    datetime.now() - datetime.fromtimestamp(raw_path.stat().st_mtime) >= CACHE_MAX_AGE
+):
+    with urlopen(URL) as resp:
+        raw = resp.read()
+    # Write atomically so an interrupted download never leaves a truncated copy.
+    tmp_path = f"{raw_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, raw_path)
+athletes = pd.read_csv(raw_path)
 
 # Normalize column names
 athletes.columns = [c.strip().lower() for c in athletes.columns]
@@ -44,9 +63,16 @@ athletes = athletes[keep_cols].dropna(subset=[name_col, birth_col])
 athletes_sample = athletes.sample(n=min(SAMPLE_N, len(athletes)), random_state=SEED)
 
 # Write files
-athletes_sample.rename(columns={name_col: "name", birth_col: "birth_date"}).to_csv(out_dir / "athletes_sample.csv", index=False)
+sample = athletes_sample.rename(columns={name_col: "name", birth_col: "birth_date"})
+sample.to_csv(out_dir / "athletes_sample.csv", index=False)
 
 athletes_sample[[name_col]].rename(columns={name_col: "name"}).to_csv(out_dir / "names.csv", index=False)
 athletes_sample[[birth_col]].rename(columns={birth_col: "birth_date"}).to_csv(out_dir / "births.csv", index=False)
 
-print(f"Wrote athletes_sample.csv, names.csv, births.csv in {out_dir}")
+# One columnar copy of the whole sample, written last so it is never older
+# than the CSVs; the metric scripts read only their columns from it.
+if PYARROW_AVAILABLE:
+    sample.to_parquet(PARQUET_PATH, index=False)
+    print(f"Wrote athletes_sample.csv, names.csv, births.csv, athletes_sample.parquet in {out_dir}")
+else:
+    print(f"Wrote athletes_sample.csv, names.csv, births.csv in {out_dir}")
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Compute name-based numerology metrics (Pythagorean + Chaldean)."""
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+from athletes_io import read_athletes
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "names.csv"
 OUT_PATH = Path(__file__).resolve().parents[1] / "data" / "name_numerology_metrics.csv"
 
@@ -10,7 +13,7 @@ if not DATA_PATH.exists():
     print(f"Name dataset not found at {DATA_PATH}. Skipping name-based metrics.")
     raise SystemExit(0)
 
-names_df = pd.read_csv(DATA_PATH)
+names_df = read_athletes(DATA_PATH, ["name"])
 if "name" not in names_df.columns:
     raise SystemExit("names.csv must contain a 'name' column")
 
@@ -41,53 +44,66 @@ CHAL_MAP = {
 VOWELS = set("AEIOUY")
 
 MASTER = {11,22,33}
+MASTER_ARR = np.array(sorted(MASTER))
+
+
+def digital_root_arr(n, preserve_master: bool = True) -> np.ndarray:
+    """Element-wise digital root of a non-negative integer array (0 stays 0)."""
+    n = np.asarray(n)
+    root = np.where(n > 0, (n - 1) % 9 + 1, 0)
+    if preserve_master:
+        root = np.where(np.isin(n, MASTER_ARR), n, root)
+    return root
+
+
+def letter_table(mapping: dict, letters=None) -> bytes:
+    """256-byte lookup table: each mapped uppercase letter's byte -> its value, every other byte -> 0."""
+    table = bytearray(256)
+    for ch, value in mapping.items():
+        if letters is None or ch in letters:
+            table[ord(ch)] = value
+    return bytes(table)
+
+
+# Letter values as byte lookup tables: whole name, vowels only (soul urge)
+# and consonants only (personality).
+PYTH_TABLE = letter_table(PYTH_MAP)
+CHAL_TABLE = letter_table(CHAL_MAP)
+PYTH_VOWEL_TABLE = letter_table(PYTH_MAP, VOWELS)
+CHAL_VOWEL_TABLE = letter_table(CHAL_MAP, VOWELS)
+PYTH_CONSONANT_TABLE = letter_table(PYTH_MAP, set(PYTH_MAP) - VOWELS)
+CHAL_CONSONANT_TABLE = letter_table(CHAL_MAP, set(CHAL_MAP) - VOWELS)
+
+
+def name_bytes(names: pd.Series) -> np.ndarray:
+    """(n_names, max_len) zero-padded uint8 matrix of the uppercased Latin-1 names."""
+    # Uppercase with str.upper (full case mapping, so e.g. "ß" still counts
+    # as "SS"); characters outside Latin-1 become "?" and, like every
+    # non-letter, look up 0.
+    encoded = np.array(
+        [name.upper().encode("latin-1", "replace") for name in names], dtype=bytes
+    )
+    return encoded.view(np.uint8).reshape(len(encoded), encoded.dtype.itemsize)
+
+
+def name_values(codes: np.ndarray, table: bytes) -> np.ndarray:
+    """Per-name letter sums: every byte of ``codes`` looked up in ``table``."""
+    return np.frombuffer(table, dtype=np.uint8)[codes].sum(axis=1, dtype=np.int64)
+
+
+names = names_df["name"].astype(str)
+codes = name_bytes(names)
+
+out = pd.DataFrame({"name": names})
+for column, table in [
+    ("pyth_expression", PYTH_TABLE),
+    ("chald_expression", CHAL_TABLE),
+    ("pyth_soul_urge", PYTH_VOWEL_TABLE),
+    ("chald_soul_urge", CHAL_VOWEL_TABLE),
+    ("pyth_personality", PYTH_CONSONANT_TABLE),
+    ("chald_personality", CHAL_CONSONANT_TABLE),
+]:
+    out[column] = digital_root_arr(name_values(codes, table))
 
-
-def digital_root(n: int, preserve_master: bool = True) -> int:
-    if preserve_master and n in MASTER:
-        return n
-    return (n - 1) % 9 + 1 if n > 0 else 0
-
-
-def name_value(name: str, mapping: dict) -> int:
-    total = 0
-    for ch in name.upper():
-        if ch.isalpha():
-            total += mapping.get(ch, 0)
-    return total
-
-
-def soul_urge(name: str, mapping: dict) -> int:
-    total = 0
-    for ch in name.upper():
-        if ch.isalpha() and ch in VOWELS:
-            total += mapping.get(ch, 0)
-    return total
-
-
-def personality(name: str, mapping: dict) -> int:
-    total = 0
-    for ch in name.upper():
-        if ch.isalpha() and ch not in VOWELS:
-            total += mapping.get(ch, 0)
-    return total
-
-rows = []
-for name in names_df["name"].astype(str):
-    py_val = name_value(name, PYTH_MAP)
-    ch_val = name_value(name, CHAL_MAP)
-
-    row = {
-        "name": name,
-        "pyth_expression": digital_root(py_val),
-        "chald_expression": digital_root(ch_val),
-        "pyth_soul_urge": digital_root(soul_urge(name, PYTH_MAP)),
-        "chald_soul_urge": digital_root(soul_urge(name, CHAL_MAP)),
-        "pyth_personality": digital_root(personality(name, PYTH_MAP)),
-        "chald_personality": digital_root(personality(name, CHAL_MAP)),
-    }
-    rows.append(row)
-
-out = pd.DataFrame(rows)
 out.to_csv(OUT_PATH, index=False)
 print(f"Wrote {OUT_PATH} with {len(out)} rows")
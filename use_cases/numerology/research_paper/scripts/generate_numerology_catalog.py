@@ -32,82 +32,135 @@ CHAL_LETTERS = {
     6: "UVW", 7: "OZ", 8: "FP"
 }
 
-rows = []
-
-def add(category, rule, parameters=None, **fields):
-    combo_id = f"{category}:{len(rows)+1:06d}"
-    row = {
-        "combo_id": combo_id,
-        "category": category,
-        "rule": rule,
-        "parameters": parameters or "",
-    }
-    row.update(fields)
-    rows.append(row)
-
-# Lo Shu grid principles
-for n, pos in LOSHU_POS.items():
-    add("lo_shu", f"Lo Shu position for {n}", f"pos={pos}", number=n)
-
-# Missing number analysis (1-9)
-for n in NUMBERS:
-    add("missing_number", f"Missing number {n}", "count=0", number=n)
+def block(category, rule, parameters="", **fields):
+    """Rows of the catalog as a DataFrame; list arguments give one row per element."""
+    return pd.DataFrame(
+        {"category": category, "rule": rule, "parameters": parameters, **fields}
+    )
+
+frames = [
+    # Lo Shu grid principles
+    block(
+        "lo_shu",
+        [f"Lo Shu position for {n}" for n in LOSHU_POS],
+        [f"pos={pos}" for pos in LOSHU_POS.values()],
+        number=list(LOSHU_POS),
+    ),
+    # Missing number analysis (1-9)
+    block(
+        "missing_number",
+        [f"Missing number {n}" for n in NUMBERS],
+        "count=0",
+        number=NUMBERS,
+    ),
+]
 
 # Repeated number (1-9)
-for n in NUMBERS:
-    for count in [2,3,4,5]:
-        add("repetition", f"Number {n} repeated {count} times", f"count={count}", number=n, count=count)
+repeats = [(n, count) for n in NUMBERS for count in [2,3,4,5]]
+frames.append(block(
+    "repetition",
+    [f"Number {n} repeated {count} times" for n, count in repeats],
+    [f"count={count}" for _, count in repeats],
+    number=[n for n, _ in repeats],
+    count=[count for _, count in repeats],
+))
 
 # Master numbers
-for n in MASTER:
-    add("master_number", f"Master number {n}", "preserve_master=true", number=n)
+frames.append(block(
+    "master_number",
+    [f"Master number {n}" for n in MASTER],
+    "preserve_master=true",
+    number=MASTER,
+))
 
 # Karmic debt
-for n in KARMIC_DEBT:
-    add("karmic_debt", f"Karmic debt {n}", "special_reduction=true", number=n)
+frames.append(block(
+    "karmic_debt",
+    [f"Karmic debt {n}" for n in KARMIC_DEBT],
+    "special_reduction=true",
+    number=KARMIC_DEBT,
+))
 
 # Compound numbers (1-99)
-for n in COMPOUND:
-    add("compound_number", f"Compound number {n}", "compound_meaning", number=n)
+frames.append(block(
+    "compound_number",
+    [f"Compound number {n}" for n in COMPOUND],
+    "compound_meaning",
+    number=COMPOUND,
+))
 
 # Life path / destiny / expression / soul urge / personality / maturity / balance
-add("personal_number", "Life Path", "birth date reduction")
-add("personal_number", "Destiny / Expression", "full name reduction")
-add("personal_number", "Soul Urge", "vowels only")
-add("personal_number", "Personality", "consonants only")
-add("personal_number", "Maturity", "life path + destiny")
-add("personal_number", "Balance", "initials reduction")
+frames.append(block(
+    "personal_number",
+    [
+        "Life Path", "Destiny / Expression", "Soul Urge",
+        "Personality", "Maturity", "Balance",
+    ],
+    [
+        "birth date reduction", "full name reduction", "vowels only",
+        "consonants only", "life path + destiny", "initials reduction",
+    ],
+))
 
 # Pinnacles and Challenges
-for i in range(1, 5):
-    add("pinnacle", f"Pinnacle {i}", "derived from birth month/day/year")
-    add("challenge", f"Challenge {i}", "derived from birth month/day/year")
+frames.append(block(
+    ["pinnacle", "challenge"] * 4,
+    [f"{name} {i}" for i in range(1, 5) for name in ("Pinnacle", "Challenge")],
+    "derived from birth month/day/year",
+))
 
 # Karmic lessons / hidden passion (missing or dominant numbers)
-for n in NUMBERS:
-    add("karmic_lesson", f"Karmic lesson {n}", "missing from name")
-    add("hidden_passion", f"Hidden passion {n}", "dominant in name")
+frames.append(block(
+    ["karmic_lesson", "hidden_passion"] * len(NUMBERS),
+    [f"{name} {n}" for n in NUMBERS for name in ("Karmic lesson", "Hidden passion")],
+    ["missing from name", "dominant in name"] * len(NUMBERS),
+))
 
 # Vedic numerology mapping
-for n, p in VEDIC_PLANETS.items():
-    add("vedic_mapping", f"Vedic number {n} maps to {p}", "mulanka/bhagyanka", number=n, planet=p)
+frames.append(block(
+    "vedic_mapping",
+    [f"Vedic number {n} maps to {p}" for n, p in VEDIC_PLANETS.items()],
+    "mulanka/bhagyanka",
+    number=list(VEDIC_PLANETS),
+    planet=list(VEDIC_PLANETS.values()),
+))
 
 # Pythagorean name numerology mapping
-for n, letters in PYTH_LETTERS.items():
-    add("pythagorean_mapping", f"Pythagorean letters for {n}", f"letters={letters}", number=n)
+frames.append(block(
+    "pythagorean_mapping",
+    [f"Pythagorean letters for {n}" for n in PYTH_LETTERS],
+    [f"letters={letters}" for letters in PYTH_LETTERS.values()],
+    number=list(PYTH_LETTERS),
+))
 
 # Chaldean name numerology mapping
-for n, letters in CHAL_LETTERS.items():
-    add("chaldean_mapping", f"Chaldean letters for {n}", f"letters={letters}", number=n)
+frames.append(block(
+    "chaldean_mapping",
+    [f"Chaldean letters for {n}" for n in CHAL_LETTERS],
+    [f"letters={letters}" for letters in CHAL_LETTERS.values()],
+    number=list(CHAL_LETTERS),
+))
 
 # Date-based transits (day number, month number, year number)
-for n in NUMBERS:
-    add("transit_day", f"Universal Day Number = {n}", "date reduction", number=n)
-    add("transit_month", f"Universal Month Number = {n}", "month reduction", number=n)
-    add("transit_year", f"Universal Year Number = {n}", "year reduction", number=n)
+transits = [
+    (n, unit, basis)
+    for n in NUMBERS
+    for unit, basis in [("day", "date"), ("month", "month"), ("year", "year")]
+]
+frames.append(block(
+    [f"transit_{unit}" for _, unit, _ in transits],
+    [f"Universal {unit.title()} Number = {n}" for n, unit, _ in transits],
+    [f"{basis} reduction" for _, _, basis in transits],
+    number=[n for n, _, _ in transits],
+))
+
+# One concat at the end; combo_id numbers rows across the whole catalog.
+catalog = pd.concat(frames, ignore_index=True)
+row_no = pd.Series(range(1, len(catalog) + 1)).astype(str).str.zfill(6)
+catalog.insert(0, "combo_id", catalog["category"] + ":" + row_no)
 
 out_dir = Path(__file__).resolve().parents[1] / "data"
 out_dir.mkdir(parents=True, exist_ok=True)
 cat_path = out_dir / "numerology_catalog.csv"
-pd.DataFrame(rows).to_csv(cat_path, index=False)
-print(f"Wrote {cat_path} with {len(rows)} rows")
+catalog.to_csv(cat_path, index=False)
+print(f"Wrote {cat_path} with {len(catalog)} rows")
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Generate daily numerology metrics and pattern frequencies for a date range."""
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 START = date(2024, 1, 1)
@@ -9,38 +10,36 @@ END = date(2024, 12, 31)
 
 # Numerology helpers
 
-def digital_root(n: int) -> int:
-    return (n - 1) % 9 + 1 if n > 0 else 0
-
-rows = []
-cur = START
-while cur <= END:
-    day = cur.day
-    month = cur.month
-    year = cur.year
-    udn = digital_root(day + month + sum(int(c) for c in str(year)))
-    umn = digital_root(month + sum(int(c) for c in str(year)))
-    uyn = digital_root(sum(int(c) for c in str(year)))
-
-    # Count digits in YYYYMMDD for Lo Shu / missing number analysis
-    datestr = cur.strftime('%Y%m%d')
-    counts = {str(i): datestr.count(str(i)) for i in range(1, 10)}
-
-    row = {
-        'date': cur.isoformat(),
-        'udn': udn,
-        'umn': umn,
-        'uyn': uyn,
-    }
-    for i in range(1, 10):
-        row[f'count_{i}'] = counts[str(i)]
-        row[f'missing_{i}'] = 1 if counts[str(i)] == 0 else 0
-    rows.append(row)
-    cur += timedelta(days=1)
+def digital_root_arr(n) -> np.ndarray:
+    """Element-wise digital root of a non-negative integer array (0 stays 0)."""
+    n = np.asarray(n)
+    return np.where(n > 0, (n - 1) % 9 + 1, 0)
+
+dates = pd.date_range(START, END, freq='D')
+year = dates.year.to_numpy(dtype=np.int64)
+month = dates.month.to_numpy(dtype=np.int64)
+day = dates.day.to_numpy(dtype=np.int64)
+
+# Digits of YYYYMMDD, most significant first: shape (8, n_days)
+ymd = year * 10000 + month * 100 + day
+digits = np.stack([ymd // 10**p % 10 for p in range(7, -1, -1)])
+year_digit_sum = digits[:4].sum(axis=0)
+
+out = {
+    'date': dates.strftime('%Y-%m-%d'),
+    'udn': digital_root_arr(day + month + year_digit_sum),
+    'umn': digital_root_arr(month + year_digit_sum),
+    'uyn': digital_root_arr(year_digit_sum),
+}
+# Count digits in YYYYMMDD for Lo Shu / missing number analysis
+for i in range(1, 10):
+    count = (digits == i).sum(axis=0)
+    out[f'count_{i}'] = count
+    out[f'missing_{i}'] = (count == 0).astype(int)
 
 out_dir = Path(__file__).resolve().parents[1] / 'data'
 out_dir.mkdir(parents=True, exist_ok=True)
 metric_path = out_dir / 'numerology_daily_metrics.csv'
 
-pd.DataFrame(rows).to_csv(metric_path, index=False)
-print(f"Wrote {metric_path} with {len(rows)} rows")
+pd.DataFrame(out).to_csv(metric_path, index=False)
+print(f"Wrote {metric_path} with {len(dates)} rows")